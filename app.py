@@ -911,7 +911,7 @@ def api_refresh_calibration():
     
     return jsonify({
         'success': success,
-        'message': 'Calibration status refreshed' if success else 'Failed to refresh calibration status'
+        'message': 'Calibration status refresh queued' if success else 'Failed to queue calibration status refresh'
     })
     
 
@@ -945,7 +945,7 @@ def api_calibrate_pump_with_refresh(pump_id):
     success = calibrate_pump(pump_id, actual_volume)
     
     if success:
-        # Update cached calibration status after successful calibration
+        # Queue a cached calibration status refresh after successful calibration
         refresh_success = refresh_pump_calibrations()
         if not refresh_success:
             logger.warning(f"Calibration succeeded but cache refresh failed for pump {pump_id}")
@@ -95,6 +95,8 @@ I2C_DEFAULT_ADDRESS = 103  # Factory default for EZO pumps (0x67)
 
 # EZO pump timing constants
 EZO_COMMAND_DELAY = 0.3  # 300ms delay required by EZO pumps
+EZO_POLL_INTERVAL = 0.02  # Read-back poll period within EZO_COMMAND_DELAY
+PUMP_STATUS_MIN_INTERVAL = 0.05  # Min gap between "R" volume reads while dispensing (~0.5ml at 10ml/s)
 EZO_MAX_RETRIES = 3
 EZO_RETRY_DELAY = 0.1
 
@@ -155,6 +157,13 @@ FLOW_METER_INTERRUPT_EDGE = "FALLING"  # Interrupt on FALLING edge (optocoupler
 # margin; raise it only if idle relay switching produces phantom pulses.
 FLOW_PULSE_DEBOUNCE_SECONDS = 0.008
 
+# Kernel glitch filter (microseconds, 0 = off): a level change must hold this
+# long before lgpio reports the edge, so sub-millisecond bounce/EMI spikes are
+# dropped without waking the Python callback. Must stay well under the pulse
+# width at max flow (~half the spacing above); the software window still
+# applies on top of it.
+FLOW_PULSE_GLITCH_FILTER_US = 1000
+
 # =============================================================================
 # EZO EC/pH SENSOR CONFIGURATION (Direct I2C on Raspberry Pi)
 # =============================================================================
@@ -163,6 +172,10 @@ FLOW_PULSE_DEBOUNCE_SECONDS = 0.008
 EZO_PH_ADDRESS = 0x63  # 99 decimal - pH sensor
 EZO_EC_ADDRESS = 0x64  # 100 decimal - EC sensor
 
+# Readings younger than this (seconds) are reused instead of re-reading the
+# circuits, so bursts of dashboard polls cost one I2C cycle
+EZO_READ_CACHE_TTL = 1.0
+
 # EC/pH sensor calibration points
 EC_CALIBRATION_SOLUTIONS = {
     "dry": 0,
@@ -5,10 +5,12 @@ Extracted from working simple_gui.py patterns for reliable hardware control
 """
 
 import logging
+import queue
+import re
 import threading
 import time
-from datetime import datetime
-from typing import Optional, Dict, Any, Union
+from types import SimpleNamespace
+from typing import Optional, Dict, Any, List, Union
 
 # Import the proven working system
 from main import FeedControlSystem
@@ -22,6 +24,98 @@ from config import (
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Precomputed command strings. The relay/pump ID sets are fixed by config.py,
+# so the full set of relay and stop commands is small and closed; build it
+# once here instead of re-formatting on every call.
+# ID sets for O(1) validation (the config getters build a fresh list per call)
+_AVAILABLE_PUMPS = frozenset(get_available_pumps())
+_AVAILABLE_RELAYS = frozenset(get_available_relays())
+_AVAILABLE_FLOW_METERS = frozenset(get_available_flow_meters())
+
+# Pump info fields read by _build_pump_status(); the all-pump snapshot copies
+# only these columns instead of every cached field.
+_PUMP_STATUS_FIELDS = (
+    'name', 'voltage', 'calibrated', 'connected',
+    'is_dispensing', 'current_volume', 'target_volume'
+)
+
+_RELAY_COMMANDS = {
+    (relay_id, state): f"Start;Relay;{relay_id};{'ON' if state else 'OFF'};end"
+    for relay_id in (0, *get_available_relays())
+    for state in (True, False)
+}
+_PUMP_STOP_COMMANDS = {pump_id: f"Start;Pump;{pump_id};X;end" for pump_id in get_available_pumps()}
+_FLOW_STOP_COMMANDS = {flow_id: f"Start;StartFlow;{flow_id};0;end" for flow_id in get_available_flow_meters()}
+_DISPENSE_PREFIXES = {pump_id: f"Start;Dispense;{pump_id};" for pump_id in get_available_pumps()}
+_FLOW_START_PREFIXES = {flow_id: f"Start;StartFlow;{flow_id};" for flow_id in get_available_flow_meters()}
+_EC_PH_ON_COMMAND = "Start;EcPh;ON;end"
+_EC_PH_OFF_COMMAND = "Start;EcPh;OFF;end"
+
+# EZO pump query replies: "Cal,?" -> ?CAL,n and "PV,?" -> ?PV,v. Firmware has
+# been seen returning both ?CAL and ?Cal, so match case-insensitively.
+_EZO_QUERY_RE = re.compile(r"\?(CAL|PV),(\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# Fixed parts of "not available" error replies; callers add the variable keys
+_PUMP_SYSTEM_UNAVAILABLE = {'success': False, 'error': 'System not available'}
+_SENSOR_UNAVAILABLE = {'success': False, 'error': 'Sensor controller not available'}
+_SYSTEM_STATUS_UNAVAILABLE = {'error': 'System not available', 'system_ready': False}
+
+# Sensor calibration point -> (sensor controller method, takes a value)
+_PH_CALIBRATION_ACTIONS = {
+    'mid': ('calibrate_ph_mid', True),
+    'low': ('calibrate_ph_low', True),
+    'high': ('calibrate_ph_high', True),
+    'clear': ('clear_ph_calibration', False),
+}
+_EC_CALIBRATION_ACTIONS = {
+    'dry': ('calibrate_ec_dry', False),
+    'single': ('calibrate_ec_single', True),
+    'low': ('calibrate_ec_low', True),
+    'high': ('calibrate_ec_high', True),
+    'clear': ('clear_ec_calibration', False),
+}
+
+# EZO pump calibration level (n in ?CAL,n) -> API status name
+_PUMP_CALIBRATION_LEVELS = {
+    0: "uncalibrated",
+    1: "single_point",
+    2: "volume_calibrated",
+    3: "fully_calibrated"
+}
+
+
+# Last formatted status timestamp: [epoch second, string]. Status is polled
+# several times a second, so reuse the string until the second changes. The
+# unlocked update race is benign - every writer stores the same value.
+_timestamp_cache = [None, ""]
+
+
+def _now_str() -> str:
+    """Current local time as 'YYYY-MM-DD HH:MM:SS', formatted at most once per second"""
+    now = int(time.time())
+    cache = _timestamp_cache
+    if cache[0] != now:
+        cache[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        cache[0] = now
+    return cache[1]
+
+
+def _parse_ezo_response(response: str):
+    """
+    Parse an EZO pump reply in one pass
+    
+    Returns:
+        tuple: ('CAL', n) / ('PV', volts) for query replies, ('R', ml) for a
+        bare number (the "R" reply), or (None, None) if unrecognized
+    """
+    match = _EZO_QUERY_RE.match(response)
+    if match:
+        return match.group(1).upper(), float(match.group(2))
+    try:
+        return 'R', float(response)
+    except ValueError:
+        return None, None
+
 class HardwareComms:
     """
     Hardware communications class using the exact same patterns as simple_gui.py
@@ -31,6 +125,15 @@ class HardwareComms:
     def __init__(self):
         self.system: Optional[FeedControlSystem] = None
         self.system_lock = threading.Lock()
+        
+        # Background calibration refresh (see refresh_pump_calibrations)
+        self._calibration_requests: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._calibration_thread: Optional[threading.Thread] = None
+        self._calibration_thread_lock = threading.Lock()
+        
+        # The hardware roster is fixed by config.py; build its payload once
+        self._available_hardware = self._build_available_hardware()
+        
         self._initialize_system()
     
     def _initialize_system(self) -> bool:
@@ -47,16 +150,28 @@ class HardwareComms:
                 logger.info("✓ Feed control system started successfully")
                 return True
             except Exception as e:
-                logger.error(f"✗ Failed to start system: {e}")
+                logger.error("✗ Failed to start system: %s", e)
                 self.system = None
                 return False
     
     def get_system(self) -> Optional[FeedControlSystem]:
-        """Get the system instance, initializing if needed"""
-        if self.system is None:
-            self._initialize_system()
+        """Get the system instance, initializing if needed
+
+        Double-checked: the steady-state path is a single unlocked attribute
+        read; system_lock is only taken (and the check repeated) inside
+        _initialize_system() when no system exists yet.
+        """
+        system = self.system
+        if system is not None:
+            return system
+        self._initialize_system()
         return self.system
     
+    # Status readers (get_pump_status, read_ec_ph_sensors, ...) read
+    # self.system directly: the system is started in __init__, and a status
+    # poll should report "not available" rather than block on a restart.
+    # Control paths go through get_system() and may re-initialize.
+    
     def is_system_ready(self) -> bool:
         """Check if the system is ready for commands"""
         return self.system is not None
@@ -82,27 +197,26 @@ class HardwareComms:
             return False
         
         # Same validation as simple_gui.py
-        if relay_id != 0 and relay_id not in get_available_relays():
-            logger.error(f"Invalid relay ID: {relay_id}")
+        if relay_id != 0 and relay_id not in _AVAILABLE_RELAYS:
+            logger.error("Invalid relay ID: %s", relay_id)
             return False
         
-        # Exact same command format as simple_gui.py
-        state_str = "ON" if state else "OFF"
-        command = f"Start;Relay;{relay_id};{state_str};end"
+        # Exact same command format as simple_gui.py (precomputed)
+        command = _RELAY_COMMANDS[(relay_id, bool(state))]
         
         try:
             success = sys.send_command(command)
             
             if success:
-                relay_name = get_relay_name(relay_id) if relay_id != 0 else "All Relays"
-                action = "turned on" if state else "turned off"
-                logger.info(f"{relay_name} {action}")
+                logger.info("%s %s",
+                            get_relay_name(relay_id) if relay_id != 0 else "All Relays",
+                            "turned on" if state else "turned off")
             else:
-                logger.error(f"Failed to control relay {relay_id}")
+                logger.error("Failed to control relay %s", relay_id)
             
             return success
         except Exception as e:
-            logger.error(f"Exception controlling relay {relay_id}: {e}")
+            logger.error("Exception controlling relay %s: %s", relay_id, e)
             return False
     
     def all_relays_off(self) -> bool:
@@ -130,36 +244,85 @@ class HardwareComms:
             return False
         
         # Same validation as simple_gui.py
-        if pump_id not in get_available_pumps():
-            logger.error(f"Invalid pump ID: {pump_id}")
-            return False
-        
-        try:
-            amount = float(amount_ml)
-            if not (MIN_PUMP_VOLUME_ML <= amount <= MAX_PUMP_VOLUME_ML):
-                logger.error(f"Amount must be between {MIN_PUMP_VOLUME_ML} and {MAX_PUMP_VOLUME_ML}ml, got: {amount}")
-                return False
-        except (ValueError, TypeError):
-            logger.error(f"Invalid amount value: {amount_ml}")
+        amount = self._validate_dispense(pump_id, amount_ml)
+        if amount is None:
             return False
         
         # Exact same command format as simple_gui.py
-        command = f"Start;Dispense;{pump_id};{amount};end"
+        command = f"{_DISPENSE_PREFIXES[pump_id]}{amount};end"
         
         try:
             success = sys.send_command(command)
             
             if success:
-                pump_name = get_pump_name(pump_id)
-                logger.info(f"Dispensing {amount}ml from {pump_name}")
+                logger.info("Dispensing %sml from %s", amount, get_pump_name(pump_id))
             else:
-                logger.error(f"Failed to start dispense from pump {pump_id}")
+                logger.error("Failed to start dispense from pump %s", pump_id)
             
             return success
         except Exception as e:
-            logger.error(f"Exception dispensing from pump {pump_id}: {e}")
+            logger.error("Exception dispensing from pump %s: %s", pump_id, e)
             return False
     
+    def dispense_batch(self, recipes: Dict[int, Union[int, float]]) -> List[bool]:
+        """
+        Dispense from several pumps, validating the whole recipe first
+        
+        Every pump ID and amount is checked before any command is queued, so
+        an invalid entry can't leave a recipe half-dispensed. Commands are
+        then queued back-to-back in recipe order.
+        
+        Args:
+            recipes: {pump_id: amount_ml}
+        
+        Returns:
+            list: Success status per recipe entry, in order
+        """
+        sys = self.get_system()
+        if not sys:
+            logger.error("System not available for pump control")
+            return [False] * len(recipes)
+        
+        amounts = {pid: self._validate_dispense(pid, ml) for pid, ml in recipes.items()}
+        if None in amounts.values():
+            logger.error("Dispense batch rejected: invalid pump ID or amount")
+            return [False] * len(recipes)
+        
+        send = sys.send_command
+        results = []
+        for pid, amount in amounts.items():
+            try:
+                success = send(f"{_DISPENSE_PREFIXES[pid]}{amount};end")
+            except Exception as e:
+                logger.error("Exception dispensing from pump %s: %s", pid, e)
+                success = False
+            if success:
+                logger.info("Dispensing %sml from %s", amount, get_pump_name(pid))
+            else:
+                logger.error("Failed to start dispense from pump %s", pid)
+            results.append(success)
+        
+        return results
+    
+    @staticmethod
+    def _validate_dispense(pump_id: int, amount_ml: Union[int, float]) -> Optional[float]:
+        """Validate a pump ID and dispense amount; return the amount as float, or None"""
+        if pump_id not in _AVAILABLE_PUMPS:
+            logger.error("Invalid pump ID: %s", pump_id)
+            return None
+        
+        try:
+            amount = float(amount_ml)
+        except (ValueError, TypeError):
+            logger.error("Invalid amount value: %s", amount_ml)
+            return None
+        
+        if not (MIN_PUMP_VOLUME_ML <= amount <= MAX_PUMP_VOLUME_ML):
+            logger.error("Amount must be between %s and %sml, got: %s", MIN_PUMP_VOLUME_ML, MAX_PUMP_VOLUME_ML, amount)
+            return None
+        
+        return amount
+    
     def stop_pump(self, pump_id: int) -> bool:
         """
         Stop pump using exact same command as simple_gui.py
@@ -176,27 +339,65 @@ class HardwareComms:
             return False
         
         # Same validation
-        if pump_id not in get_available_pumps():
-            logger.error(f"Invalid pump ID: {pump_id}")
+        if pump_id not in _AVAILABLE_PUMPS:
+            logger.error("Invalid pump ID: %s", pump_id)
             return False
         
-        # Exact same command format as simple_gui.py
-        command = f"Start;Pump;{pump_id};X;end"
+        # Exact same command format as simple_gui.py (precomputed)
+        command = _PUMP_STOP_COMMANDS[pump_id]
         
         try:
             success = sys.send_command(command)
             
             if success:
-                pump_name = get_pump_name(pump_id)
-                logger.info(f"Stopped {pump_name}")
+                logger.info("Stopped %s", get_pump_name(pump_id))
             else:
-                logger.error(f"Failed to stop pump {pump_id}")
+                logger.error("Failed to stop pump %s", pump_id)
             
             return success
         except Exception as e:
-            logger.error(f"Exception stopping pump {pump_id}: {e}")
+            logger.error("Exception stopping pump %s: %s", pump_id, e)
             return False
     
+    def stop_pumps(self, pump_ids=None) -> List[bool]:
+        """
+        Stop several pumps, resolving the system and command path once
+        
+        Args:
+            pump_ids: Pump IDs to stop (None = every configured pump)
+        
+        Returns:
+            list: Success status per pump, in order
+        """
+        if pump_ids is None:
+            pump_ids = get_available_pumps()
+        
+        sys = self.get_system()
+        if not sys:
+            logger.error("System not available for pump control")
+            return [False] * len(pump_ids)
+        
+        send = sys.send_command
+        results = []
+        for pid in pump_ids:
+            command = _PUMP_STOP_COMMANDS.get(pid)
+            if command is None:
+                logger.error("Invalid pump ID: %s", pid)
+                results.append(False)
+                continue
+            try:
+                success = send(command)
+            except Exception as e:
+                logger.error("Exception stopping pump %s: %s", pid, e)
+                success = False
+            if success:
+                logger.info("Stopped %s", get_pump_name(pid))
+            else:
+                logger.error("Failed to stop pump %s", pid)
+            results.append(success)
+        
+        return results
+    
     def calibrate_pump(self, pump_id: int, actual_volume_ml: float) -> bool:
         """
         Calibrate EZO pump with actual dispensed volume
@@ -218,15 +419,14 @@ class HardwareComms:
             success = sys.pump_controller.calibrate_pump(pump_id, actual_volume_ml)
             
             if success:
-                pump_name = get_pump_name(pump_id)
-                logger.info(f"Calibrated {pump_name} with {actual_volume_ml}ml")
+                logger.info("Calibrated %s with %sml", get_pump_name(pump_id), actual_volume_ml)
             else:
-                logger.error(f"Failed to calibrate pump {pump_id}")
+                logger.error("Failed to calibrate pump %s", pump_id)
             
             return success
             
         except Exception as e:
-            logger.error(f"Exception calibrating pump {pump_id}: {e}")
+            logger.error("Exception calibrating pump %s: %s", pump_id, e)
             return False
 
     def clear_pump_calibration(self, pump_id: int) -> bool:
@@ -253,13 +453,12 @@ class HardwareComms:
                 # Update cached calibration status
                 sys.pump_controller.calibration_status[pump_id] = 0
                 sys.pump_controller.pump_info[pump_id]['calibrated'] = False
-                pump_name = get_pump_name(pump_id)
-                logger.info(f"Cleared calibration for {pump_name}")
+                logger.info("Cleared calibration for %s", get_pump_name(pump_id))
             
             return success
             
         except Exception as e:
-            logger.error(f"Exception clearing pump {pump_id} calibration: {e}")
+            logger.error("Exception clearing pump %s calibration: %s", pump_id, e)
             return False
 
     def check_pump_calibration_status(self, pump_id: int) -> dict:
@@ -272,79 +471,114 @@ class HardwareComms:
         Returns:
             dict: Calibration status info
         """
-        sys = self.get_system()
+        sys = self.system
         if not sys or not sys.pump_controller:
             logger.error("System or pump controller not available for checking calibration")
-            return {
-                'success': False,
-                'pump_id': pump_id,
-                'error': 'System not available'
-            }
+            return {**_PUMP_SYSTEM_UNAVAILABLE, 'pump_id': pump_id}
         
         try:
-            # Send Cal,? command to get real-time calibration status
-            cal_response = sys.pump_controller.send_command(pump_id, "Cal,?")
-            logger.debug(f"Pump {pump_id}: Cal,? live response = '{cal_response}'")
-            
-            if cal_response:
-                # Parse calibration status - EZO pump Cal,? returns ?CAL,n (uppercase) where n is calibration status
-                if cal_response.startswith("?CAL,"):
-                    try:
-                        cal_status = int(cal_response.split(',')[1])
-                        
-                        # Update cached status
-                        sys.pump_controller.calibration_status[pump_id] = cal_status
-                        sys.pump_controller.pump_info[pump_id]['calibrated'] = cal_status > 0
-                        
-                        logger.info(f"Pump {pump_id}: Live calibration status {cal_status}")
-                    except (IndexError, ValueError) as e:
-                        logger.warning(f"Pump {pump_id}: Failed to parse live calibration response '{cal_response}': {e}")
-                        cal_status = 0
-                elif cal_response.startswith("?Cal,"):
-                    # Handle mixed case format too
-                    try:
-                        cal_status = int(cal_response.split(',')[1])
-                        
-                        # Update cached status
-                        sys.pump_controller.calibration_status[pump_id] = cal_status
-                        sys.pump_controller.pump_info[pump_id]['calibrated'] = cal_status > 0
-                        
-                        logger.info(f"Pump {pump_id}: Live calibration status {cal_status}")
-                    except (IndexError, ValueError) as e:
-                        logger.warning(f"Pump {pump_id}: Failed to parse live calibration response '{cal_response}': {e}")
-                        cal_status = 0
-                else:
-                    # Response doesn't match expected format
-                    logger.warning(f"Pump {pump_id}: Unexpected live calibration response format: '{cal_response}'")
-                    cal_status = 0
-            else:
-                cal_status = 0  # Default to uncalibrated if command failed
-                logger.warning(f"Pump {pump_id}: No response to live Cal,? command")
-            
-            status_map = {
-                0: "uncalibrated",
-                1: "single_point",
-                2: "volume_calibrated",
-                3: "fully_calibrated"
-            }
+            cal_status, cal_response = self._read_live_calibration(sys.pump_controller, pump_id)
             
             return {
                 'success': True,
                 'pump_id': pump_id,
-                'calibration_status': status_map.get(cal_status, "unknown"),
+                'calibration_status': _PUMP_CALIBRATION_LEVELS.get(cal_status, "unknown"),
                 'calibration_level': cal_status,
                 'calibrated': cal_status > 0,
                 'raw_response': cal_response
             }
             
         except Exception as e:
-            logger.error(f"Exception checking pump {pump_id} calibration: {e}")
+            logger.error("Exception checking pump %s calibration: %s", pump_id, e)
             return {
                 'success': False,
                 'pump_id': pump_id,
                 'error': str(e)
             }
 
+    def check_pump_calibrations_batch(self, pump_ids=None) -> Dict[int, int]:
+        """
+        Check live "Cal,?" calibration status for several pumps in one sweep
+        
+        The queries go out through the pump controller's send_commands():
+        every "Cal,?" is written first and all replies are polled against one
+        shared deadline, so the sweep costs about one pump's processing time
+        rather than one per pump. A pump that misses the sweep is asked again
+        on its own. The calibration cache is updated as replies are parsed.
+        
+        Args:
+            pump_ids: Pump IDs to check (default: all available pumps)
+        
+        Returns:
+            dict: {pump_id: calibration level}, empty if the system is not available
+        """
+        sys = self.system
+        if not sys or not sys.pump_controller:
+            logger.error("System or pump controller not available for checking calibration")
+            return {}
+        
+        pump_controller = sys.pump_controller
+        ids = []
+        for pid in (get_available_pumps() if pump_ids is None else pump_ids):
+            if pid not in _AVAILABLE_PUMPS:
+                logger.error("Invalid pump ID: %s", pid)
+                continue
+            ids.append(pid)
+        if not ids:
+            return {}
+        
+        try:
+            responses = pump_controller.send_commands([(pid, "Cal,?") for pid in ids])
+        except Exception as e:
+            logger.error("Exception in batched calibration sweep: %s", e)
+            responses = [None] * len(ids)
+        
+        levels = {}
+        for pid, cal_response in zip(ids, responses):
+            try:
+                if cal_response is None:
+                    levels[pid] = self._read_live_calibration(pump_controller, pid)[0]
+                else:
+                    levels[pid] = self._store_live_calibration(pump_controller, pid, cal_response)
+            except Exception as e:
+                logger.error("Exception checking pump %s calibration: %s", pid, e)
+                levels[pid] = 0
+        
+        return levels
+    
+    @classmethod
+    def _read_live_calibration(cls, pump_controller, pump_id: int):
+        """Send "Cal,?" to one pump, update its cached status; return (level, raw response)"""
+        # Send Cal,? command to get real-time calibration status
+        cal_response = pump_controller.send_command(pump_id, "Cal,?")
+        return cls._store_live_calibration(pump_controller, pump_id, cal_response), cal_response
+    
+    @staticmethod
+    def _store_live_calibration(pump_controller, pump_id: int, cal_response) -> int:
+        """Parse a "Cal,?" reply into the pump's cached status; return the level"""
+        logger.debug("Pump %s: Cal,? live response = '%s'", pump_id, cal_response)
+        
+        if cal_response:
+            # Parse calibration status - EZO pump Cal,? returns ?CAL,n where n is calibration status
+            kind, value = _parse_ezo_response(cal_response)
+            if kind == 'CAL':
+                cal_status = int(value)
+                
+                # Update cached status
+                pump_controller.calibration_status[pump_id] = cal_status
+                pump_controller.pump_info[pump_id]['calibrated'] = cal_status > 0
+                
+                logger.info("Pump %s: Live calibration status %s", pump_id, cal_status)
+            else:
+                # Response doesn't match expected format
+                logger.warning("Pump %s: Unexpected live calibration response format: '%s'", pump_id, cal_response)
+                cal_status = 0
+        else:
+            cal_status = 0  # Default to uncalibrated if command failed
+            logger.warning("Pump %s: No response to live Cal,? command", pump_id)
+        
+        return cal_status
+
     def get_pump_status(self, pump_id: int = None) -> dict:
         """
         Get pump status using cached data from existing controller (no new initialization!)
@@ -355,7 +589,7 @@ class HardwareComms:
         Returns:
             dict: Pump status information
         """
-        sys = self.get_system()
+        sys = self.system
         if not sys or not sys.pump_controller:
             logger.error("System or pump controller not available for getting pump status")
             return {'error': 'System not available'}
@@ -367,17 +601,7 @@ class HardwareComms:
                 # Return single pump status using cached calibration
                 pump_info = pump_controller.get_pump_info(pump_id)
                 if pump_info:
-                    result = {
-                        'id': pump_id,
-                        'name': pump_info.get('name', f'Pump {pump_id}'),
-                        'voltage': pump_info.get('voltage', 0),
-                        'calibrated': pump_controller.is_calibrated(pump_id),  # Use cached status
-                        'status': 'ready' if pump_controller.is_calibrated(pump_id) else 'uncalibrated',
-                        'connected': pump_info.get('connected', False),
-                        'is_dispensing': pump_info.get('is_dispensing', False),
-                        'current_volume': pump_info.get('current_volume', 0),
-                        'target_volume': pump_info.get('target_volume', 0)
-                    }
+                    result = self._build_pump_status(pump_id, pump_info, pump_controller.is_calibrated(pump_id))
                 else:
                     result = {
                         'id': pump_id,
@@ -385,41 +609,117 @@ class HardwareComms:
                         'error': 'Pump not found'
                     }
             else:
-                # Return all pump statuses using cached calibration
-                result = {}
-                for pid in get_available_pumps():
-                    pump_info = pump_controller.get_pump_info(pid)
-                    if pump_info:
-                        result[pid] = {
-                            'id': pid,
-                            'name': pump_info.get('name', f'Pump {pid}'),
-                            'voltage': pump_info.get('voltage', 0),
-                            'calibrated': pump_controller.is_calibrated(pid),  # Use cached status
-                            'status': 'ready' if pump_controller.is_calibrated(pid) else 'uncalibrated',
-                            'connected': pump_info.get('connected', False),
-                            'is_dispensing': pump_info.get('is_dispensing', False),
-                            'current_volume': pump_info.get('current_volume', 0),
-                            'target_volume': pump_info.get('target_volume', 0)
-                        }
+                # Return all pump statuses from one batched cache snapshot
+                build = self._build_pump_status
+                pump_infos = pump_controller.get_pump_info_batch(get_available_pumps(), _PUMP_STATUS_FIELDS)
+                result = {pid: build(pid, info, info.get('calibrated', False))
+                          for pid, info in pump_infos.items()}
             
             return result
             
         except Exception as e:
-            logger.error(f"Exception getting pump status: {e}")
+            logger.error("Exception getting pump status: %s", e)
             return {'error': str(e)}
 
-    def refresh_pump_calibrations(self) -> bool:
+    @staticmethod
+    def _build_pump_status(pump_id: int, pump_info: dict, calibrated: bool) -> dict:
+        """Shape a cached pump info dict into the API pump status payload"""
+        return {
+            'id': pump_id,
+            'name': pump_info.get('name', f'Pump {pump_id}'),
+            'voltage': pump_info.get('voltage', 0),
+            'calibrated': calibrated,  # Use cached status
+            'status': 'ready' if calibrated else 'uncalibrated',
+            'connected': pump_info.get('connected', False),
+            'is_dispensing': pump_info.get('is_dispensing', False),
+            'current_volume': pump_info.get('current_volume', 0),
+            'target_volume': pump_info.get('target_volume', 0)
+        }
+
+    def refresh_pump_calibrations(self, wait: bool = False, timeout: Optional[float] = None) -> bool:
         """
-        Manually refresh calibration status for all pumps using existing controller
+        Refresh calibration status for all pumps on the calibration worker thread
+        
+        Querying every pump's "Cal,?" is a sequential I2C sweep, so it runs on
+        a dedicated worker instead of the caller's thread. Requests that pile
+        up while a sweep is running are coalesced into the next sweep. Updated
+        values land in the controller cache and reach the UI via status polling.
+        
+        Args:
+            wait: Block until the sweep covering this request has finished
+            timeout: Max seconds to wait when wait=True (None = no limit)
         
         Returns:
-            bool: Success status
+            bool: True if queued (wait=False) or if the sweep succeeded (wait=True)
         """
         sys = self.get_system()
         if not sys or not sys.pump_controller:
             logger.error("System or pump controller not available for refreshing calibrations")
             return False
         
+        request = SimpleNamespace(done=threading.Event(), success=False)
+        self._start_calibration_worker()
+        self._calibration_requests.put(request)
+        
+        if not wait:
+            logger.info("Pump calibration refresh queued")
+            return True
+        
+        if not request.done.wait(timeout):
+            logger.error("Timed out waiting for pump calibration refresh")
+            return False
+        return request.success
+    
+    def _start_calibration_worker(self):
+        """Start the calibration refresh worker thread if it isn't running"""
+        with self._calibration_thread_lock:
+            if self._calibration_thread is None or not self._calibration_thread.is_alive():
+                # Drop any stop sentinel left behind by a cleanup() whose join
+                # timed out, so the new worker doesn't exit on it at once
+                requests = self._calibration_requests
+                leftover = []
+                try:
+                    while True:
+                        leftover.append(requests.get_nowait())
+                except queue.Empty:
+                    pass
+                for request in leftover:
+                    if request is not None:
+                        requests.put(request)
+                
+                self._calibration_thread = threading.Thread(
+                    target=self._calibration_worker, name="PumpCalibrationRefresh", daemon=True
+                )
+                self._calibration_thread.start()
+    
+    def _calibration_worker(self):
+        """Serve coalesced calibration refresh requests; a None request stops the worker"""
+        requests = self._calibration_requests
+        while True:
+            pending = [requests.get()]
+            try:
+                while True:
+                    pending.append(requests.get_nowait())
+            except queue.Empty:
+                pass
+            
+            stop = None in pending
+            pending = [request for request in pending if request is not None]
+            if pending:
+                success = self._run_calibration_refresh()
+                for request in pending:
+                    request.success = success
+                    request.done.set()
+            if stop:
+                return
+    
+    def _run_calibration_refresh(self) -> bool:
+        """Run one calibration sweep through the existing pump controller"""
+        sys = self.system
+        if not sys or not sys.pump_controller:
+            logger.error("System or pump controller not available for refreshing calibrations")
+            return False
+        
         try:
             # Use existing controller - this will update the cached calibration status
             sys.pump_controller._check_all_calibrations()
@@ -427,7 +727,7 @@ class HardwareComms:
             return True
             
         except Exception as e:
-            logger.error(f"Exception refreshing calibrations: {e}")
+            logger.error("Exception refreshing calibrations: %s", e)
             return False
 
     def pause_pump(self, pump_id: int) -> bool:
@@ -451,13 +751,12 @@ class HardwareComms:
             success = response is not None
             
             if success:
-                pump_name = get_pump_name(pump_id)
-                logger.info(f"Paused {pump_name}")
+                logger.info("Paused %s", get_pump_name(pump_id))
             
             return success
             
         except Exception as e:
-            logger.error(f"Exception pausing pump {pump_id}: {e}")
+            logger.error("Exception pausing pump %s: %s", pump_id, e)
             return False
 
     def get_pump_voltage(self, pump_id: int) -> dict:
@@ -470,18 +769,15 @@ class HardwareComms:
         Returns:
             dict: Voltage info
         """
-        sys = self.get_system()
+        sys = self.system
         if not sys or not sys.pump_controller:
             logger.error("System or pump controller not available for getting voltage")
-            return {
-                'success': False,
-                'pump_id': pump_id,
-                'error': 'System not available'
-            }
+            return {**_PUMP_SYSTEM_UNAVAILABLE, 'pump_id': pump_id}
         
+        pump_controller = sys.pump_controller
         try:
             # First try to get cached voltage info
-            pump_info = sys.pump_controller.get_pump_info(pump_id)
+            pump_info = pump_controller.get_pump_info(pump_id)
             if pump_info and pump_info.get('voltage', 0) > 0:
                 return {
                     'success': True,
@@ -491,22 +787,18 @@ class HardwareComms:
                 }
             
             # If no cached voltage, get it fresh
-            response = sys.pump_controller.send_command(pump_id, "PV,?")
+            response = pump_controller.send_command(pump_id, "PV,?")
             
-            if response and response.startswith("?PV,"):
-                voltage_str = response.split(",")[1] if "," in response else "0"
-                try:
-                    voltage = float(voltage_str)
-                    # Update cached voltage
-                    sys.pump_controller.pump_info[pump_id]['voltage'] = voltage
-                    return {
-                        'success': True,
-                        'pump_id': pump_id,
-                        'voltage': voltage,
-                        'raw_response': response
-                    }
-                except ValueError:
-                    pass
+            kind, voltage = _parse_ezo_response(response) if response else (None, None)
+            if kind == 'PV':
+                # Update cached voltage
+                pump_controller.pump_info[pump_id]['voltage'] = voltage
+                return {
+                    'success': True,
+                    'pump_id': pump_id,
+                    'voltage': voltage,
+                    'raw_response': response
+                }
             
             return {
                 'success': False,
@@ -515,7 +807,7 @@ class HardwareComms:
             }
             
         except Exception as e:
-            logger.error(f"Exception getting pump {pump_id} voltage: {e}")
+            logger.error("Exception getting pump %s voltage: %s", pump_id, e)
             return {
                 'success': False,
                 'pump_id': pump_id,
@@ -532,18 +824,15 @@ class HardwareComms:
         Returns:
             dict: Volume info
         """
-        sys = self.get_system()
+        sys = self.system
         if not sys or not sys.pump_controller:
             logger.error("System or pump controller not available for getting current volume")
-            return {
-                'success': False,
-                'pump_id': pump_id,
-                'error': 'System not available'
-            }
+            return {**_PUMP_SYSTEM_UNAVAILABLE, 'pump_id': pump_id}
         
+        pump_controller = sys.pump_controller
         try:
             # First try to get cached volume info
-            pump_info = sys.pump_controller.get_pump_info(pump_id)
+            pump_info = pump_controller.get_pump_info(pump_id)
             if pump_info and pump_info.get('is_dispensing', False):
                 return {
                     'success': True,
@@ -553,19 +842,16 @@ class HardwareComms:
                 }
             
             # If not dispensing or no cached data, get it fresh
-            response = sys.pump_controller.send_command(pump_id, "R")
+            response = pump_controller.send_command(pump_id, "R")
             
-            if response:
-                try:
-                    volume = float(response)
-                    return {
-                        'success': True,
-                        'pump_id': pump_id,
-                        'current_volume': volume,
-                        'raw_response': response
-                    }
-                except ValueError:
-                    pass
+            kind, volume = _parse_ezo_response(response) if response else (None, None)
+            if kind == 'R':
+                return {
+                    'success': True,
+                    'pump_id': pump_id,
+                    'current_volume': volume,
+                    'raw_response': response
+                }
             
             return {
                 'success': False,
@@ -574,7 +860,7 @@ class HardwareComms:
             }
             
         except Exception as e:
-            logger.error(f"Exception getting pump {pump_id} current volume: {e}")
+            logger.error("Exception getting pump %s current volume: %s", pump_id, e)
             return {
                 'success': False,
                 'pump_id': pump_id,
@@ -602,34 +888,33 @@ class HardwareComms:
             return False
         
         # Same validation as simple_gui.py
-        if flow_id not in get_available_flow_meters():
-            logger.error(f"Invalid flow meter ID: {flow_id}")
+        if flow_id not in _AVAILABLE_FLOW_METERS:
+            logger.error("Invalid flow meter ID: %s", flow_id)
             return False
         
         try:
             gal = int(gallons)
             if not (1 <= gal <= MAX_FLOW_GALLONS):
-                logger.error(f"Gallons must be between 1 and {MAX_FLOW_GALLONS}, got: {gal}")
+                logger.error("Gallons must be between 1 and %s, got: %s", MAX_FLOW_GALLONS, gal)
                 return False
         except (ValueError, TypeError):
-            logger.error(f"Invalid gallons value: {gallons}")
+            logger.error("Invalid gallons value: %s", gallons)
             return False
         
         # Same command format as simple_gui.py
-        command = f"Start;StartFlow;{flow_id};{gal};220;end"
+        command = f"{_FLOW_START_PREFIXES[flow_id]}{gal};220;end"
         
         try:
             success = sys.send_command(command)
             
             if success:
-                meter_name = get_flow_meter_name(flow_id)
-                logger.info(f"Started {meter_name} for {gal} gallons")
+                logger.info("Started %s for %s gallons", get_flow_meter_name(flow_id), gal)
             else:
-                logger.error(f"Failed to start flow meter {flow_id}")
+                logger.error("Failed to start flow meter %s", flow_id)
             
             return success
         except Exception as e:
-            logger.error(f"Exception starting flow meter {flow_id}: {e}")
+            logger.error("Exception starting flow meter %s: %s", flow_id, e)
             return False
     
     def stop_flow(self, flow_id: int) -> bool:
@@ -647,25 +932,24 @@ class HardwareComms:
             logger.error("System not available for flow control")
             return False
         
-        if flow_id not in get_available_flow_meters():
-            logger.error(f"Invalid flow meter ID: {flow_id}")
+        if flow_id not in _AVAILABLE_FLOW_METERS:
+            logger.error("Invalid flow meter ID: %s", flow_id)
             return False
         
         # Stop flow by setting gallons to 0
-        command = f"Start;StartFlow;{flow_id};0;end"
+        command = _FLOW_STOP_COMMANDS[flow_id]
         
         try:
             success = sys.send_command(command)
             
             if success:
-                meter_name = get_flow_meter_name(flow_id)
-                logger.info(f"Stopped {meter_name}")
+                logger.info("Stopped %s", get_flow_meter_name(flow_id))
             else:
-                logger.error(f"Failed to stop flow meter {flow_id}")
+                logger.error("Failed to stop flow meter %s", flow_id)
             
             return success
         except Exception as e:
-            logger.error(f"Exception stopping flow meter {flow_id}: {e}")
+            logger.error("Exception stopping flow meter %s: %s", flow_id, e)
             return False
 
     def get_flow_status(self, flow_id: int) -> Optional[Dict[str, Any]]:
@@ -678,19 +962,19 @@ class HardwareComms:
         Returns:
             dict: Flow meter status or None if not available
         """
-        sys = self.get_system()
+        sys = self.system
         if not sys:
             logger.error("System not available for flow status")
             return None
 
-        if flow_id not in get_available_flow_meters():
-            logger.error(f"Invalid flow meter ID: {flow_id}")
+        if flow_id not in _AVAILABLE_FLOW_METERS:
+            logger.error("Invalid flow meter ID: %s", flow_id)
             return None
 
         try:
             return sys.get_flow_status(flow_id)
         except Exception as e:
-            logger.error(f"Exception getting flow status {flow_id}: {e}")
+            logger.error("Exception getting flow status %s: %s", flow_id, e)
             return None
 
     def get_flow_controller(self):
@@ -724,7 +1008,7 @@ class HardwareComms:
             return False
         
         # Exact same command format as simple_gui.py
-        command = "Start;EcPh;ON;end"
+        command = _EC_PH_ON_COMMAND
         
         try:
             success = sys.send_command(command)
@@ -736,7 +1020,7 @@ class HardwareComms:
             
             return success
         except Exception as e:
-            logger.error(f"Exception starting EC/pH monitoring: {e}")
+            logger.error("Exception starting EC/pH monitoring: %s", e)
             return False
     
     def stop_ec_ph(self) -> bool:
@@ -752,7 +1036,7 @@ class HardwareComms:
             return False
 
         # Exact same command format as simple_gui.py
-        command = "Start;EcPh;OFF;end"
+        command = _EC_PH_OFF_COMMAND
 
         try:
             success = sys.send_command(command)
@@ -764,7 +1048,7 @@ class HardwareComms:
 
             return success
         except Exception as e:
-            logger.error(f"Exception stopping EC/pH monitoring: {e}")
+            logger.error("Exception stopping EC/pH monitoring: %s", e)
             return False
 
     def read_ec_ph_sensors(self) -> dict:
@@ -774,13 +1058,10 @@ class HardwareComms:
         Returns:
             dict: EC and pH readings with timestamp
         """
-        sys = self.get_system()
+        sys = self.system
         if not sys or not sys.sensor_controller:
             logger.error("Sensor controller not available")
-            return {
-                'success': False,
-                'error': 'Sensor controller not available'
-            }
+            return dict(_SENSOR_UNAVAILABLE)
 
         try:
             readings = sys.sensor_controller.read_sensors()
@@ -791,7 +1072,7 @@ class HardwareComms:
                 'timestamp': readings.get('timestamp')
             }
         except Exception as e:
-            logger.error(f"Exception reading EC/pH sensors: {e}")
+            logger.error("Exception reading EC/pH sensors: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -808,25 +1089,26 @@ class HardwareComms:
         Returns:
             bool: Success status
         """
-        sys = self.get_system()
+        return self._calibrate_ph(self.get_system(), point, value)
+
+    @staticmethod
+    def _calibrate_ph(sys: Optional[FeedControlSystem], point: str, value: float = None) -> bool:
+        """calibrate_ph() against an already-resolved system"""
         if not sys or not sys.sensor_controller:
             logger.error("Sensor controller not available for pH calibration")
             return False
 
+        action = _PH_CALIBRATION_ACTIONS.get(point)
+        if action is None:
+            logger.error("Invalid pH calibration point: %s", point)
+            return False
+        
         try:
-            if point == 'mid':
-                return sys.sensor_controller.calibrate_ph_mid(value)
-            elif point == 'low':
-                return sys.sensor_controller.calibrate_ph_low(value)
-            elif point == 'high':
-                return sys.sensor_controller.calibrate_ph_high(value)
-            elif point == 'clear':
-                return sys.sensor_controller.clear_ph_calibration()
-            else:
-                logger.error(f"Invalid pH calibration point: {point}")
-                return False
+            method_name, takes_value = action
+            method = getattr(sys.sensor_controller, method_name)
+            return method(value) if takes_value else method()
         except Exception as e:
-            logger.error(f"Exception calibrating pH: {e}")
+            logger.error("Exception calibrating pH: %s", e)
             return False
 
     def calibrate_ec(self, point: str, value: int = None) -> bool:
@@ -840,27 +1122,26 @@ class HardwareComms:
         Returns:
             bool: Success status
         """
-        sys = self.get_system()
+        return self._calibrate_ec(self.get_system(), point, value)
+
+    @staticmethod
+    def _calibrate_ec(sys: Optional[FeedControlSystem], point: str, value: int = None) -> bool:
+        """calibrate_ec() against an already-resolved system"""
         if not sys or not sys.sensor_controller:
             logger.error("Sensor controller not available for EC calibration")
             return False
 
+        action = _EC_CALIBRATION_ACTIONS.get(point)
+        if action is None:
+            logger.error("Invalid EC calibration point: %s", point)
+            return False
+        
         try:
-            if point == 'dry':
-                return sys.sensor_controller.calibrate_ec_dry()
-            elif point == 'single':
-                return sys.sensor_controller.calibrate_ec_single(value)
-            elif point == 'low':
-                return sys.sensor_controller.calibrate_ec_low(value)
-            elif point == 'high':
-                return sys.sensor_controller.calibrate_ec_high(value)
-            elif point == 'clear':
-                return sys.sensor_controller.clear_ec_calibration()
-            else:
-                logger.error(f"Invalid EC calibration point: {point}")
-                return False
+            method_name, takes_value = action
+            method = getattr(sys.sensor_controller, method_name)
+            return method(value) if takes_value else method()
         except Exception as e:
-            logger.error(f"Exception calibrating EC: {e}")
+            logger.error("Exception calibrating EC: %s", e)
             return False
 
     def get_sensor_calibration_status(self) -> dict:
@@ -870,17 +1151,18 @@ class HardwareComms:
         Returns:
             dict: Calibration status information
         """
-        sys = self.get_system()
+        return self._sensor_calibration_status(self.get_system())
+
+    @staticmethod
+    def _sensor_calibration_status(sys: Optional[FeedControlSystem]) -> dict:
+        """get_sensor_calibration_status() against an already-resolved system"""
         if not sys or not sys.sensor_controller:
             logger.error("Sensor controller not available")
-            return {
-                'success': False,
-                'error': 'Sensor controller not available'
-            }
+            return dict(_SENSOR_UNAVAILABLE)
 
         try:
-            ph_status = sys.sensor_controller.get_ph_calibration_status()
-            ec_status = sys.sensor_controller.get_ec_calibration_status()
+            # Both circuits answer "Cal,?" in one shared processing wait
+            ph_status, ec_status = sys.sensor_controller.get_calibration_statuses()
 
             return {
                 'success': True,
@@ -894,7 +1176,7 @@ class HardwareComms:
                 }
             }
         except Exception as e:
-            logger.error(f"Exception getting sensor calibration status: {e}")
+            logger.error("Exception getting sensor calibration status: %s", e)
             return {
                 'success': False,
                 'error': str(e)
@@ -921,7 +1203,7 @@ class HardwareComms:
         try:
             return sys.tank_monitor_manager.get_readings(tank_id)
         except Exception as e:
-            logger.error(f"Exception getting tank monitor readings: {e}")
+            logger.error("Exception getting tank monitor readings: %s", e)
             return {'error': str(e)}
 
     # =========================================================================
@@ -945,7 +1227,7 @@ class HardwareComms:
         try:
             return sys.soil_sensor_manager.get_readings(sensor_id)
         except Exception as e:
-            logger.error(f"Exception getting soil sensor readings: {e}")
+            logger.error("Exception getting soil sensor readings: %s", e)
             return {'error': str(e)}
 
     # =========================================================================
@@ -969,7 +1251,7 @@ class HardwareComms:
             logger.warning("🚨 EMERGENCY STOP ACTIVATED 🚨")
             return True
         except Exception as e:
-            logger.error(f"Exception during emergency stop: {e}")
+            logger.error("Exception during emergency stop: %s", e)
             return False
     
     # =========================================================================
@@ -985,26 +1267,22 @@ class HardwareComms:
         """
         sys = self.get_system()
         if not sys:
-            return {
-                'error': 'System not available',
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'system_ready': False
-            }
+            return {**_SYSTEM_STATUS_UNAVAILABLE, 'timestamp': _now_str()}
         
         try:
             # Same status call as simple_gui.py
             status = sys.get_system_status()
             
             # Add timestamp and system ready flag
-            status['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            status['timestamp'] = _now_str()
             status['system_ready'] = True
             
             return status
         except Exception as e:
-            logger.error(f"Exception getting system status: {e}")
+            logger.error("Exception getting system status: %s", e)
             return {
                 'error': f'Status error: {e}',
-                'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'timestamp': _now_str(),
                 'system_ready': False
             }
     
@@ -1012,9 +1290,17 @@ class HardwareComms:
         """
         Get available hardware configuration
         
+        The payload is built once at startup and shared between calls, so
+        callers must treat it as read-only.
+        
         Returns:
             dict: Available hardware information
         """
+        return self._available_hardware
+    
+    @staticmethod
+    def _build_available_hardware() -> Dict[str, Any]:
+        """Build the available hardware payload from config.py"""
         return {
             'pumps': {
                 'ids': list(get_available_pumps()),
@@ -1042,21 +1328,27 @@ class HardwareComms:
     
     def cleanup(self):
         """Clean up system resources"""
+        with self._calibration_thread_lock:
+            if self._calibration_thread is not None:
+                self._calibration_requests.put(None)
+                self._calibration_thread.join(timeout=5)
+                # Keep the reference while a sweep is still running; the
+                # thread exits on the queued sentinel once it finishes
+                if self._calibration_thread.is_alive():
+                    logger.warning("Pump calibration refresh still running after cleanup timeout")
+                else:
+                    self._calibration_thread = None
+        
         with self.system_lock:
             if self.system:
                 try:
-                    # Turn off all relays for safety
-                    self.all_relays_off()
-                    logger.info("All relays turned off during cleanup")
-                except Exception as e:
-                    logger.error(f"Error turning off relays during cleanup: {e}")
-                
-                try:
-                    # Stop the system
+                    # Stop the system. stop() joins the worker and then runs
+                    # emergency_stop(), which turns all relays off directly -
+                    # a queued "all relays off" command would only repeat it.
                     self.system.stop()
                     logger.info("System stopped during cleanup")
                 except Exception as e:
-                    logger.error(f"Error stopping system during cleanup: {e}")
+                    logger.error("Error stopping system during cleanup: %s", e)
                 
                 self.system = None
 
@@ -1069,8 +1361,15 @@ _hardware_comms: Optional[HardwareComms] = None
 _comms_lock = threading.Lock()
 
 def get_hardware_comms() -> HardwareComms:
-    """Get or create the global hardware communications instance"""
+    """Get or create the global hardware communications instance
+
+    Double-checked: once the instance exists this is a plain global read;
+    _comms_lock is only taken to create it (or after cleanup_hardware()).
+    """
     global _hardware_comms
+    comms = _hardware_comms
+    if comms is not None:
+        return comms
     with _comms_lock:
         if _hardware_comms is None:
             _hardware_comms = HardwareComms()
@@ -1085,10 +1384,18 @@ def dispense_pump(pump_id: int, amount_ml: Union[int, float]) -> bool:
     """Dispense from pump - convenience function"""
     return get_hardware_comms().dispense_pump(pump_id, amount_ml)
 
+def dispense_batch(recipes: Dict[int, Union[int, float]]) -> List[bool]:
+    """Dispense a multi-pump recipe - convenience function"""
+    return get_hardware_comms().dispense_batch(recipes)
+
 def stop_pump(pump_id: int) -> bool:
     """Stop pump - convenience function"""
     return get_hardware_comms().stop_pump(pump_id)
 
+def stop_pumps(pump_ids=None) -> List[bool]:
+    """Stop several pumps - convenience function"""
+    return get_hardware_comms().stop_pumps(pump_ids)
+
 def start_flow(flow_id: int, gallons: Union[int, float]) -> bool:
     """Start flow - convenience function"""
     return get_hardware_comms().start_flow(flow_id, gallons)
@@ -1133,6 +1440,10 @@ def check_pump_calibration_status(pump_id: int) -> dict:
     """Check pump calibration status - convenience function"""
     return get_hardware_comms().check_pump_calibration_status(pump_id)
 
+def check_pump_calibrations_batch(pump_ids=None) -> Dict[int, int]:
+    """Check live calibration for several pumps - convenience function"""
+    return get_hardware_comms().check_pump_calibrations_batch(pump_ids)
+
 def pause_pump(pump_id: int) -> bool:
     """Pause pump - convenience function"""
     return get_hardware_comms().pause_pump(pump_id)
@@ -1149,9 +1460,9 @@ def get_pump_status(pump_id: int = None) -> dict:
     """Get pump status - convenience function"""
     return get_hardware_comms().get_pump_status(pump_id)
 
-def refresh_pump_calibrations() -> bool:
+def refresh_pump_calibrations(wait: bool = False, timeout: Optional[float] = None) -> bool:
     """Refresh pump calibrations - convenience function"""
-    return get_hardware_comms().refresh_pump_calibrations()
+    return get_hardware_comms().refresh_pump_calibrations(wait, timeout)
 
 def read_ec_ph_sensors() -> dict:
     """Read EC/pH sensors - convenience function"""
@@ -4,22 +4,44 @@ Mock Hardware Controllers for Development and Testing
 Provides realistic mock implementations for all hardware components
 """
 
+import os
 import time
 import logging
+import threading
 import random
+from types import MappingProxyType
 from typing import Dict, Any, Optional, List
 
+from config import (
+    PUMP_ADDRESSES, MIN_PUMP_VOLUME_ML, MAX_PUMP_VOLUME_ML,
+    RELAY_GPIO_PINS, RELAY_ACTIVE_HIGH,
+    get_pump_name, get_relay_name, get_available_relays,
+    validate_relay_id
+)
+
 logger = logging.getLogger(__name__)
 
+# Set MOCK_FAST=1 to drop the simulated command/switching delays (e.g. when
+# running test scripts against the mocks); controllers can also be built
+# with simulate_latency=False directly.
+SIMULATE_LATENCY = os.environ.get('MOCK_FAST', '') in ('', '0')
+
+# Bound once so the per-command failure rolls skip the module attribute
+# lookup; still driven by the global generator, so random.seed() applies.
+_random = random.random
+
 class MockPumpController:
     """Mock EZO Pump Controller with realistic behavior"""
     
-    def __init__(self, bus_number=1):
+    __slots__ = ('bus_number', 'mock_mode', 'simulate_latency', 'pump_info',
+                 '_status_view', '_command_handlers')
+    
+    def __init__(self, bus_number=1, simulate_latency=None):
         self.bus_number = bus_number
         self.mock_mode = True
+        self.simulate_latency = SIMULATE_LATENCY if simulate_latency is None else simulate_latency
         
         # Mock pump information storage
-        from config import PUMP_ADDRESSES, get_pump_name
         self.pump_info = {}
         for pump_id in PUMP_ADDRESSES.keys():
             self.pump_info[pump_id] = {
@@ -36,6 +58,17 @@ class MockPumpController:
                 'connected': True,
                 'dispense_start_time': None
             }
+        self._status_view = {pump_id: MappingProxyType(info) for pump_id, info in self.pump_info.items()}
+        
+        # Exact-match EZO commands -> response handler (see send_command)
+        self._command_handlers = {
+            "i": self._handle_info,
+            "Cal,?": self._handle_cal_query,
+            "PV,?": self._handle_voltage,
+            "Name,?": self._handle_name,
+            "X": self._handle_stop,
+            "R": self._handle_read,
+        }
         
         logger.info(f"Mock pump controller initialized with {len(PUMP_ADDRESSES)} pumps")
     
@@ -45,63 +78,88 @@ class MockPumpController:
     
     def send_command(self, pump_id, command, delay=None):
         """Mock command sending with realistic responses"""
-        from config import validate_pump_id, get_pump_name
-        
-        if not validate_pump_id(pump_id):
+        info = self.pump_info.get(pump_id)
+        if info is None:
             logger.error(f"Invalid pump ID: {pump_id}")
             return None
         
         # Simulate command delay
-        time.sleep(delay or 0.1)
-        
-        pump_name = get_pump_name(pump_id)
-        
+        if self.simulate_latency:
+            time.sleep(delay or 0.1)
+        
+        return self._respond(pump_id, info, command)
+    
+    def send_commands(self, batch, delay=None):
+        """Mock batched send: the whole batch shares one simulated delay"""
+        if self.simulate_latency:
+            time.sleep(delay or 0.1)
+        
+        responses = []
+        for pump_id, command in batch:
+            info = self.pump_info.get(pump_id)
+            if info is None:
+                logger.error(f"Invalid pump ID: {pump_id}")
+                responses.append(None)
+            else:
+                responses.append(self._respond(pump_id, info, command))
+        return responses
+    
+    def _respond(self, pump_id, info, command):
+        """Build the mock reply to one command (failure roll included)"""
         # Simulate occasional failures (5% chance)
-        if random.random() < 0.05:
+        if _random() < 0.05:
             logger.warning(f"Mock pump {pump_id} simulated communication failure")
-            self.pump_info[pump_id]['connected'] = False
+            info['connected'] = False
             return None
         
-        self.pump_info[pump_id]['connected'] = True
+        info['connected'] = True
         
-        # Handle different commands
-        if command == "i":
-            return f"?I,PMP,1.0"
-        elif command == "Cal,?":
-            return "?Cal,1"  # Mock as single-point calibrated
-        elif command.startswith("Cal,"):
-            return "OK"
-        elif command == "PV,?":
-            voltage = self.pump_info[pump_id]['voltage']
-            return f"?PV,{voltage:.1f}"
-        elif command == "Name,?":
-            return f"?Name,{pump_name}"
-        elif command.startswith("D,"):
-            # Dispense command
-            try:
-                volume = float(command.split(",")[1])
-                self.pump_info[pump_id]['target_volume'] = volume
-                self.pump_info[pump_id]['current_volume'] = 0.0
-                self.pump_info[pump_id]['is_dispensing'] = True
-                self.pump_info[pump_id]['dispense_start_time'] = time.time()
+        # Handle different commands: exact matches first, then the
+        # parameterised "D,<ml>" / "Cal,<ml>" forms; anything else is "OK"
+        handler = self._command_handlers.get(command)
+        if handler is None:
+            if command.startswith("D,"):
+                handler = self._handle_dispense
+            else:  # includes "Cal,<ml>"
                 return "OK"
-            except (IndexError, ValueError):
-                return "ER"
-        elif command == "X":
-            # Stop command
-            if self.pump_info[pump_id]['is_dispensing']:
-                dispensed = self.pump_info[pump_id]['current_volume']
-                self.pump_info[pump_id]['is_dispensing'] = False
-                self.pump_info[pump_id]['total_volume'] += dispensed
-                return f"*DONE,{dispensed:.2f}"
-            return "OK"
-        elif command == "R":
-            # Read current volume
-            if self.pump_info[pump_id]['is_dispensing']:
-                return str(self.pump_info[pump_id]['current_volume'])
-            return "0.00"
-        else:
+        return handler(pump_id, info, command)
+    
+    def _handle_info(self, pump_id, info, command):
+        return "?I,PMP,1.0"
+    
+    def _handle_cal_query(self, pump_id, info, command):
+        return "?Cal,1"  # Mock as single-point calibrated
+    
+    def _handle_voltage(self, pump_id, info, command):
+        return f"?PV,{info['voltage']:.1f}"
+    
+    def _handle_name(self, pump_id, info, command):
+        return f"?Name,{get_pump_name(pump_id)}"
+    
+    def _handle_dispense(self, pump_id, info, command):
+        try:
+            volume = float(command.split(",")[1])
+            info['target_volume'] = volume
+            info['current_volume'] = 0.0
+            info['is_dispensing'] = True
+            info['dispense_start_time'] = time.time()
             return "OK"
+        except (IndexError, ValueError):
+            return "ER"
+    
+    def _handle_stop(self, pump_id, info, command):
+        if info['is_dispensing']:
+            dispensed = info['current_volume']
+            info['is_dispensing'] = False
+            info['total_volume'] += dispensed
+            return f"*DONE,{dispensed:.2f}"
+        return "OK"
+    
+    def _handle_read(self, pump_id, info, command):
+        # Read current volume
+        if info['is_dispensing']:
+            return str(info['current_volume'])
+        return "0.00"
     
     def initialize_pumps(self):
         """Mock pump initialization"""
@@ -109,16 +167,15 @@ class MockPumpController:
     
     def start_dispense(self, pump_id, volume_ml):
         """Mock dispense start"""
-        from config import validate_pump_id, MIN_PUMP_VOLUME_ML, MAX_PUMP_VOLUME_ML
-        
-        if not validate_pump_id(pump_id):
+        info = self.pump_info.get(pump_id)
+        if info is None:
             return False
         
         if not (MIN_PUMP_VOLUME_ML <= volume_ml <= MAX_PUMP_VOLUME_ML):
             logger.error(f"Volume {volume_ml}ml outside valid range")
             return False
         
-        if self.pump_info[pump_id]['is_dispensing']:
+        if info['is_dispensing']:
             logger.warning(f"Pump {pump_id} is already dispensing")
             return False
         
@@ -127,9 +184,7 @@ class MockPumpController:
     
     def stop_dispense(self, pump_id):
         """Mock dispense stop"""
-        from config import validate_pump_id
-        
-        if not validate_pump_id(pump_id):
+        if pump_id not in self.pump_info:
             return None
         
         response = self.send_command(pump_id, "X")
@@ -143,49 +198,55 @@ class MockPumpController:
     
     def check_pump_status(self, pump_id):
         """Mock pump status check with realistic progression"""
-        from config import validate_pump_id
-        
-        if not validate_pump_id(pump_id):
-            return False
-        
-        if not self.pump_info[pump_id]['is_dispensing']:
+        info = self.pump_info.get(pump_id)
+        if info is None or not info['is_dispensing']:
             return False
         
         # Simulate realistic dispensing progression
-        if self.pump_info[pump_id]['dispense_start_time']:
-            elapsed = time.time() - self.pump_info[pump_id]['dispense_start_time']
-            target = self.pump_info[pump_id]['target_volume']
+        if info['dispense_start_time']:
+            elapsed = time.time() - info['dispense_start_time']
+            target = info['target_volume']
             
             # Simulate dispensing at ~10ml/second
             progress = min(elapsed * 10.0, target)
-            self.pump_info[pump_id]['current_volume'] = progress
+            info['current_volume'] = progress
             
             # Complete when target reached
             if progress >= target:
-                self.pump_info[pump_id]['is_dispensing'] = False
-                self.pump_info[pump_id]['total_volume'] += progress
+                info['is_dispensing'] = False
+                info['total_volume'] += progress
                 return False
         
         return True
     
     def get_pump_info(self, pump_id):
         """Get mock pump information"""
-        from config import validate_pump_id
-        
-        if not validate_pump_id(pump_id):
-            return None
-        
-        return self.pump_info[pump_id].copy()
+        info = self.pump_info.get(pump_id)
+        return info.copy() if info is not None else None
+
+    def get_pump_info_batch(self, pump_ids, fields=None):
+        """Get mock pump information for several pumps in one pass"""
+        pump_info = self.pump_info
+        if fields is None:
+            return {pump_id: pump_info[pump_id].copy() for pump_id in pump_ids if pump_id in pump_info}
+        return {
+            pump_id: {field: pump_info[pump_id][field] for field in fields if field in pump_info[pump_id]}
+            for pump_id in pump_ids if pump_id in pump_info
+        }
     
     def get_all_pumps_status(self):
-        """Get status of all mock pumps"""
+        """Get a snapshot (copy) of all mock pump statuses"""
         return {pump_id: info.copy() for pump_id, info in self.pump_info.items()}
     
+    def get_all_pumps_status_view(self):
+        """Get read-only live views of all mock pump statuses"""
+        return self._status_view
+    
     def emergency_stop(self):
         """Mock emergency stop"""
         logger.warning("Mock emergency stop - stopping all pumps")
-        for pump_id in self.pump_info.keys():
-            if self.pump_info[pump_id]['is_dispensing']:
+        for pump_id, info in self.pump_info.items():
+            if info['is_dispensing']:
                 self.stop_dispense(pump_id)
         logger.info("All mock pumps stopped")
     
@@ -195,17 +256,16 @@ class MockPumpController:
 
     def calibrate_pump(self, pump_id, actual_volume_ml):
         """Mock pump calibration"""
-        from config import validate_pump_id
-        if not validate_pump_id(pump_id):
+        info = self.pump_info.get(pump_id)
+        if info is None:
             return False
-        self.pump_info[pump_id]['calibrated'] = True
+        info['calibrated'] = True
         return True
 
     def get_calibration_status(self, pump_id):
         """Get cached calibration status"""
-        if pump_id in self.pump_info:
-            return 1 if self.pump_info[pump_id]['calibrated'] else 0
-        return 0
+        info = self.pump_info.get(pump_id)
+        return 1 if info is not None and info['calibrated'] else 0
 
     def is_calibrated(self, pump_id):
         """Check if pump is calibrated"""
@@ -222,10 +282,11 @@ class MockPumpController:
 class MockRelayController:
     """Mock Relay Controller with realistic behavior"""
     
-    def __init__(self):
-        from config import RELAY_GPIO_PINS, get_relay_name
-        
+    __slots__ = ('mock_mode', 'simulate_latency', 'relay_pins', 'relay_states')
+    
+    def __init__(self, simulate_latency=None):
         self.mock_mode = True
+        self.simulate_latency = SIMULATE_LATENCY if simulate_latency is None else simulate_latency
         self.relay_pins = RELAY_GPIO_PINS.copy()
         self.relay_states = {relay_id: False for relay_id in self.relay_pins.keys()}
         
@@ -237,19 +298,18 @@ class MockRelayController:
     
     def set_relay(self, relay_id, state):
         """Mock relay control with realistic behavior"""
-        from config import validate_relay_id, get_relay_name
-        
         if not validate_relay_id(relay_id):
             logger.error(f"Invalid relay ID: {relay_id}")
             return False
         
         # Simulate occasional failures (2% chance)
-        if random.random() < 0.02:
+        if _random() < 0.02:
             logger.warning(f"Mock relay {relay_id} simulated failure")
             return False
         
         # Simulate relay switching delay
-        time.sleep(0.01)
+        if self.simulate_latency:
+            time.sleep(0.01)
         
         self.relay_states[relay_id] = state
         relay_name = get_relay_name(relay_id)
@@ -258,15 +318,18 @@ class MockRelayController:
         return True
     
     def set_all_relays(self, state):
-        """Mock set all relays"""
-        success_count = 0
-        for relay_id in self.relay_pins:
-            if self.set_relay(relay_id, state):
-                success_count += 1
-        
+        """Mock set all relays as one bank write (one failure roll, one delay)"""
         state_str = "ON" if state else "OFF"
-        logger.info(f"Mock set {success_count}/{len(self.relay_pins)} relays to {state_str}")
-        return success_count == len(self.relay_pins)
+        if _random() < 0.02:
+            logger.warning(f"Mock relay bank simulated failure setting {state_str}")
+            return False
+        
+        if self.simulate_latency:
+            time.sleep(0.01)
+        
+        self.relay_states.update(dict.fromkeys(self.relay_pins, state))
+        logger.info(f"Mock set {len(self.relay_pins)} relays to {state_str}")
+        return True
     
     def get_relay_state(self, relay_id):
         """Get mock relay state"""
@@ -278,8 +341,6 @@ class MockRelayController:
     
     def toggle_relay(self, relay_id):
         """Mock toggle relay"""
-        from config import validate_relay_id
-        
         if not validate_relay_id(relay_id):
             return False
         
@@ -295,13 +356,10 @@ class MockRelayController:
     
     def get_available_relays(self):
         """Get available mock relays"""
-        from config import get_available_relays
         return get_available_relays()
     
     def get_relay_info(self, relay_id):
         """Get mock relay information"""
-        from config import validate_relay_id, get_relay_name, RELAY_ACTIVE_HIGH
-        
         if not validate_relay_id(relay_id):
             return None
         
@@ -322,15 +380,28 @@ class MockRelayController:
 class ConnectionManager:
     """Connection management and retry logic for hardware controllers"""
     
+    __slots__ = ('connection_pool', '_pool_lock', 'max_connections',
+                 'max_retries', 'retry_delay', 'max_backoff')
+    
     def __init__(self, max_connections=5):
         self.connection_pool = {}
+        self._pool_lock = threading.Lock()
         self.max_connections = max_connections
         self.max_retries = 3
         self.retry_delay = 0.1
+        self.max_backoff = 1.0
         
     def get_connection(self, bus_id):
         """Get pooled I2C connection"""
-        if bus_id not in self.connection_pool:
+        # Fast path: a single lookup once the bus has been opened
+        connection = self.connection_pool.get(bus_id)
+        if connection is not None:
+            return connection
+        
+        with self._pool_lock:
+            connection = self.connection_pool.get(bus_id)
+            if connection is not None:
+                return connection
             try:
                 import platform
                 try:
@@ -340,13 +411,14 @@ class ConnectionManager:
                         from .mock_hardware_libs import smbus2
                     else:
                         raise
-                self.connection_pool[bus_id] = smbus2.SMBus(bus_id)
+                connection = smbus2.SMBus(bus_id)
+                self.connection_pool[bus_id] = connection
                 logger.debug(f"Created new I2C connection for bus {bus_id}")
             except Exception as e:
                 logger.error(f"Failed to create I2C connection for bus {bus_id}: {e}")
                 return None
         
-        return self.connection_pool[bus_id]
+        return connection
     
     def retry_on_failure(self, func, *args, **kwargs):
         """Decorator for auto-retry logic"""
@@ -356,7 +428,9 @@ class ConnectionManager:
             except Exception as e:
                 if attempt < self.max_retries - 1:
                     logger.debug(f"Retry {attempt + 1}/{self.max_retries} for {func.__name__}: {e}")
-                    time.sleep(self.retry_delay * (attempt + 1))
+                    # Exponential backoff with a little jitter, capped
+                    backoff = min(self.retry_delay * (1 << attempt), self.max_backoff)
+                    time.sleep(backoff + random.uniform(0, 0.05))
                 else:
                     logger.error(f"Failed after {self.max_retries} retries: {e}")
                     raise
@@ -364,23 +438,24 @@ class ConnectionManager:
     
     def close_all_connections(self):
         """Close all pooled connections"""
-        for bus_id, connection in self.connection_pool.items():
-            try:
-                connection.close()
-                logger.debug(f"Closed I2C connection for bus {bus_id}")
-            except Exception as e:
-                logger.error(f"Error closing I2C connection for bus {bus_id}: {e}")
-        
-        self.connection_pool.clear()
+        with self._pool_lock:
+            for bus_id, connection in self.connection_pool.items():
+                try:
+                    connection.close()
+                    logger.debug(f"Closed I2C connection for bus {bus_id}")
+                except Exception as e:
+                    logger.error(f"Error closing I2C connection for bus {bus_id}: {e}")
+            
+            self.connection_pool.clear()
 
 # Factory functions for creating mock controllers
-def create_mock_pump_controller():
+def create_mock_pump_controller(simulate_latency=None):
     """Create mock pump controller"""
-    return MockPumpController()
+    return MockPumpController(simulate_latency=simulate_latency)
 
-def create_mock_relay_controller():
+def create_mock_relay_controller(simulate_latency=None):
     """Create mock relay controller"""
-    return MockRelayController()
+    return MockRelayController(simulate_latency=simulate_latency)
 
 def create_connection_manager():
     """Create connection manager"""
@@ -27,10 +27,43 @@ class MockSMBus:
         # Return mock "success" response for EZO pumps
         return [1, 0, 0, 0]  # EZO_RESPONSE_CODES['success'] format
     
+    def i2c_rdwr(self, *msgs):
+        """Mock combined I2C transfer - reads come back as an EZO success code"""
+        for msg in msgs:
+            logger.debug(f"Mock I2C rdwr with address {msg.addr:#04x}, length {msg.len}")
+            if msg.flags & MockI2CMsg.READ:
+                msg.buf[:] = bytes(msg.len)
+                msg.buf[0] = 1  # EZO_RESPONSE_CODES['success'] format
+    
     def close(self):
         """Mock close connection"""
         logger.debug("Mock SMBus closed")
 
+class MockI2CMsg:
+    """Mock implementation of smbus2.i2c_msg for raw I2C transfers"""
+    
+    READ = 0x0001
+    
+    def __init__(self, address, flags, data):
+        self.addr = address
+        self.flags = flags
+        self.buf = bytearray(data)
+        self.len = len(self.buf)
+    
+    @staticmethod
+    def read(address, length):
+        return MockI2CMsg(address, MockI2CMsg.READ, bytes(length))
+    
+    @staticmethod
+    def write(address, buf):
+        return MockI2CMsg(address, 0, buf)
+    
+    def __bytes__(self):
+        return bytes(self.buf)
+    
+    def __iter__(self):
+        return iter(self.buf)
+
 class MockLGPIO:
     """Mock implementation of lgpio library for GPIO operations"""
     
@@ -100,6 +133,7 @@ class MockLGPIO:
 # Create mock modules that can be imported
 class MockSMBus2Module:
     SMBus = MockSMBus
+    i2c_msg = MockI2CMsg
 
 class MockLGPIOModule:
     def __getattr__(self, name):
@@ -10,23 +10,20 @@ Follows patterns from rpi_p1umps.py and rpi_relays.py
 
 import time
 import logging
-import sys
 import threading
-from pathlib import Path
+from contextlib import ExitStack
+from functools import lru_cache
 import platform
 
 try:
-    from smbus2 import SMBus
+    from smbus2 import SMBus, i2c_msg
 except ImportError:
     if platform.system() == 'Windows':
         print("Running on Windows - using mock smbus2 for EZO sensors")
-        from .mock_hardware_libs import MockSMBus as SMBus
+        from .mock_hardware_libs import MockSMBus as SMBus, MockI2CMsg as i2c_msg
     else:
         raise
 
-# Add parent directory to path for config import
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 # Import configuration
 from config import (
     I2C_BUS_NUMBER,
@@ -34,12 +31,37 @@ from config import (
     EZO_EC_ADDRESS,
     PH_CALIBRATION_SOLUTIONS,
     EC_CALIBRATION_SOLUTIONS,
+    EZO_READ_CACHE_TTL,
     EZO_COMMAND_DELAY
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on the processing time of an "O,..." output-config command
+_CONFIG_RESPONSE_TIME = 0.3
+
+# Read-back sizes: a full reply is [response_code, data..., NUL padding];
+# commands that only acknowledge (calibration points, Cal,clear, O,...)
+# answer [1, NUL], so their read stops after two bytes
+_REPLY_LENGTH = 31
+_ACK_REPLY_LENGTH = 2
+
+# Circuit address -> latest_readings key
+_READING_KEYS = {EZO_PH_ADDRESS: 'ph', EZO_EC_ADDRESS: 'ec'}
+
+
+@lru_cache(maxsize=32)
+def _encode_command(command):
+    """Encode an EZO command once: (first byte, remaining bytes list)
+
+    The monitoring loop sends "R" to both circuits every cycle; the list is
+    only read by smbus2, so sharing it between calls is safe.
+    """
+    command_bytes = command.encode()
+    return command_bytes[0], list(command_bytes[1:])
+
+
 class EZOSensorController:
     """
     EZO pH and EC sensor controller using I2C
@@ -47,38 +69,58 @@ class EZOSensorController:
     Compatible with existing FeedControlSystem patterns
     """
 
-    def __init__(self, i2c_lock=None):
+    def __init__(self, i2c_lock=None, bus=None):
         """
         Args:
             i2c_lock: Shared threading.Lock serializing access to the physical
                 I2C bus. Pass the same lock used by the pump controller so the
                 monitoring thread's reads never interleave with a pump
                 transaction. Falls back to a private lock if not supplied.
+            bus: Already-open SMBus for the same bus (e.g. the pump
+                controller's) to reuse instead of opening another handle on
+                /dev/i2c-N. The owner closes it; close() here only drops it.
         """
         self.bus = None
+        self._shared_bus = bus
         self.connected = False
         self.monitoring_active = False
         self.monitoring_thread = None
+        self._monitoring_stop = None  # Event that wakes/ends the current loop
         self.monitoring_interval = 5.0  # Read sensors every 5 seconds
         self._i2c_lock = i2c_lock or threading.Lock()
+        self._read_msgs = {}  # (address, length) -> reusable read i2c_msg
+        # Per-circuit transaction locks (see _send_command)
+        self._address_locks = {
+            EZO_PH_ADDRESS: threading.Lock(),
+            EZO_EC_ADDRESS: threading.Lock(),
+        }
 
+        # Copy-on-write: _update_reading() swaps in a new dict, so the one
+        # handed out by get_latest_readings() never changes underneath a caller
         self.latest_readings = {
             'ph': None,
             'ec': None,
             'last_update': 0
         }
+        self._readings_lock = threading.Lock()
+        # time.monotonic() of the last successful reading, per sensor
+        self._read_times = {'ph': 0.0, 'ec': 0.0}
 
     def connect(self):
         """Connect to I2C bus and configure sensors"""
         try:
-            self.bus = SMBus(I2C_BUS_NUMBER)
+            self.bus = self._shared_bus or SMBus(I2C_BUS_NUMBER)
             self.connected = True
 
-            # Configure EC sensor outputs (EC only, disable other readings)
-            self._send_command(EZO_EC_ADDRESS, "O,EC,1")   # Enable EC
-            self._send_command(EZO_EC_ADDRESS, "O,TDS,0")  # Disable TDS
-            self._send_command(EZO_EC_ADDRESS, "O,S,0")    # Disable salinity
-            self._send_command(EZO_EC_ADDRESS, "O,SG,0")   # Disable specific gravity
+            # Configure EC sensor outputs (EC only, disable other readings).
+            # Output-config writes finish within 300 ms, not the 900 ms a
+            # reading needs, and the reply poll returns as soon as each is done.
+            for command in ("O,EC,1",    # Enable EC
+                            "O,TDS,0",   # Disable TDS
+                            "O,S,0",     # Disable salinity
+                            "O,SG,0"):   # Disable specific gravity
+                self._send_command(EZO_EC_ADDRESS, command, _CONFIG_RESPONSE_TIME,
+                                   _ACK_REPLY_LENGTH)
 
             logger.info("✓ Connected to EZO pH/EC sensors via I2C")
             return True
@@ -94,13 +136,13 @@ class EZOSensorController:
         if self.monitoring_active:
             self.stop_monitoring()
 
-        # Close I2C bus
-        if self.bus:
+        # Close I2C bus (unless it is borrowed from another controller)
+        if self.bus and self.bus is not self._shared_bus:
             self.bus.close()
-            self.bus = None
+        self.bus = None
         self.connected = False
     
-    def _send_command(self, address, command, response_time=0.9):
+    def _send_command(self, address, command, response_time=0.9, reply_length=_REPLY_LENGTH):
         """
         Send command to EZO circuit and read response
 
@@ -110,7 +152,9 @@ class EZOSensorController:
         Args:
             address: I2C address
             command: Command string
-            response_time: Time to wait for response in seconds
+            response_time: Upper bound on the wait for a response in seconds
+            reply_length: Bytes to read back (_ACK_REPLY_LENGTH for commands
+                that return no data)
 
         Returns:
             Response string or None if error
@@ -120,47 +164,17 @@ class EZOSensorController:
             return None
 
         try:
-            # Hold the shared bus lock for the whole write->wait->read
-            # transaction so a pump command on the same physical bus cannot
-            # interleave between this sensor's write and its read-back.
-            with self._i2c_lock:
-                # Send command - DIRECT I2C WRITE (no register address)
-                # Convert command string to bytes
-                command_bytes = [ord(c) for c in command]
-
-                # EZO protocol: First byte goes to "register" position, rest as data
-                # This is how smbus2 handles direct I2C writes
-                if len(command_bytes) == 1:
-                    self.bus.write_byte(address, command_bytes[0])
-                else:
-                    self.bus.write_i2c_block_data(address, command_bytes[0], command_bytes[1:])
-
-                logger.debug(f"EZO 0x{address:02X} <- '{command}'")
-
-                # Wait for processing (EZO chips need time to process)
-                time.sleep(response_time)
-
-                # Read response - DIRECT I2C READ
-                # EZO returns up to 31 bytes: [response_code, data...]
-                response_data = self.bus.read_i2c_block_data(address, 0x00, 31)
-
-            response_code = response_data[0]
-
-            if response_code == 1:  # Success
-                # Convert bytes to string, stopping at null terminator
-                response_string = ''.join([chr(b) for b in response_data[1:] if b != 0])
-                logger.debug(f"EZO 0x{address:02X} -> '{response_string.strip()}'")
-                return response_string.strip()
-            elif response_code == 2:
-                logger.error(f"EZO 0x{address:02X}: Syntax error for command '{command}'")
-            elif response_code == 254:
-                logger.warning(f"EZO 0x{address:02X}: Still processing (may need longer delay)")
-            elif response_code == 255:
-                logger.warning(f"EZO 0x{address:02X}: No data available")
-            else:
-                logger.error(f"EZO 0x{address:02X}: Unknown response code {response_code}")
-
-            return None
+            # The circuit's address lock covers the whole write->wait->read
+            # transaction, so no other command to it can take its reply. The
+            # shared bus lock is only held for each transfer: the bus is idle
+            # while the circuit processes, and pumps may use it meanwhile.
+            with self._address_locks[address]:
+                with self._i2c_lock:
+                    self._write_command(address, command)
+                response_data = self._read_when_ready(address, time.monotonic(), response_time,
+                                                      reply_length)
+
+            return self._parse_response(address, command, response_data)
 
         except OSError as e:
             logger.error(f"I2C communication error at 0x{address:02X}: {e}")
@@ -169,21 +183,148 @@ class EZOSensorController:
             logger.error(f"Unexpected error communicating with EZO sensor at 0x{address:02X}: {e}")
             return None
     
-    def _monitoring_loop(self):
-        """Background thread that continuously reads sensors when monitoring is active"""
+    def _send_commands(self, batch):
+        """
+        Send commands to several EZO circuits sharing one processing wait
+
+        All writes go out first, then every circuit is polled for its reply.
+        The circuits process in parallel, so reading pH and EC together costs
+        one wait instead of two.
+
+        Args:
+            batch: Sequence of (address, command, response_time) tuples,
+                one per distinct address
+
+        Returns:
+            List of response strings (None for a failed command), in batch order
+        """
+        responses = [None] * len(batch)
+        if not self.connected or not self.bus:
+            logger.warning("Cannot send commands - not connected to I2C bus")
+            return responses
+
+        # Same locking as _send_command. Address locks are taken in address
+        # order so two overlapping batches cannot deadlock.
+        with ExitStack() as stack:
+            for address in sorted({address for address, _, _ in batch}):
+                stack.enter_context(self._address_locks[address])
+
+            sent = []
+            with self._i2c_lock:
+                for index, (address, command, _) in enumerate(batch):
+                    try:
+                        self._write_command(address, command)
+                        sent.append(index)
+                    except OSError as e:
+                        logger.error(f"I2C communication error at 0x{address:02X}: {e}")
+
+            if not sent:
+                return responses
+
+            # The circuits process in parallel from here, so each is polled
+            # against the same start time
+            started = time.monotonic()
+            for index in sent:
+                address, command, response_time = batch[index]
+                try:
+                    response_data = self._read_when_ready(address, started, response_time)
+                    responses[index] = self._parse_response(address, command, response_data)
+                except OSError as e:
+                    logger.error(f"I2C communication error at 0x{address:02X}: {e}")
+
+        return responses
+    
+    def _read_when_ready(self, address, started, response_time, length=_REPLY_LENGTH):
+        """Poll an EZO circuit's read-back until it stops answering 254
+
+        The circuit answers 254 (still processing) until its result is ready,
+        so rather than always sleeping the full response_time, the first read
+        comes after a third of it and later reads back off from 50 ms (x1.5)
+        until a final code arrives or response_time has passed since
+        `started`. The bus lock is only held for each read, and each poll
+        is a pure read (no register write) so a busy circuit is not sent
+        anything extra.
+
+        Returns:
+            The last raw read-back: [response_code, data...] (`length` bytes)
+        """
+        deadline = started + response_time
+        time.sleep(max(0.0, started + response_time / 3 - time.monotonic()))
+        interval = 0.05
+        while True:
+            # EZO returns up to 31 bytes: [response_code, data...]
+            with self._i2c_lock:
+                response_data = self._read_reply(address, length)
+            remaining = deadline - time.monotonic()
+            if response_data[0] != 254 or remaining <= 0:
+                return response_data
+            time.sleep(min(interval, remaining))
+            interval *= 1.5
+    
+    def _read_reply(self, address, length):
+        """Read `length` reply bytes from an EZO circuit; caller holds _i2c_lock
+
+        Same approach as EZOPumpController._read_reply: a plain I2C read
+        through a reusable i2c_msg, copied out with bytes() before the bus
+        lock is released.
+        """
+        msg = self._read_msgs.get((address, length))
+        if msg is None:
+            msg = self._read_msgs[(address, length)] = i2c_msg.read(address, length)
+        self.bus.i2c_rdwr(msg)
+        return bytes(msg)
+    
+    def _write_command(self, address, command):
+        """Write a command to an EZO circuit (no register); caller holds _i2c_lock
+
+        EZO protocol: first byte goes to "register" position, rest as data.
+        This is how smbus2 handles direct I2C writes.
+        """
+        first, rest = _encode_command(command)
+        if not rest:
+            self.bus.write_byte(address, first)
+        else:
+            self.bus.write_i2c_block_data(address, first, rest)
+        logger.debug("EZO 0x%02X <- '%s'", address, command)
+    
+    @staticmethod
+    def _parse_response(address, command, response_data):
+        """Decode an EZO read-back ([response_code, data...]) to a string or None"""
+        response_code = response_data[0]
+
+        if response_code == 1:  # Success
+            # The reply is NUL-terminated: cut at the first NUL in C instead
+            # of filtering every padding byte (latin-1 maps each byte to the
+            # same code point chr() would)
+            response_string = bytes(response_data[1:]).partition(b'\x00')[0].decode('latin-1').strip()
+            logger.debug("EZO 0x%02X -> '%s'", address, response_string)
+            return response_string
+        elif response_code == 2:
+            logger.error(f"EZO 0x{address:02X}: Syntax error for command '{command}'")
+        elif response_code == 254:
+            logger.warning(f"EZO 0x{address:02X}: Still processing (may need longer delay)")
+        elif response_code == 255:
+            logger.warning(f"EZO 0x{address:02X}: No data available")
+        else:
+            logger.error(f"EZO 0x{address:02X}: Unknown response code {response_code}")
+
+        return None
+    
+    def _monitoring_loop(self, stop_event):
+        """Background thread that continuously reads sensors until stop_event is set"""
         logger.info("Sensor monitoring loop started")
 
-        while self.monitoring_active:
+        while not stop_event.is_set():
             try:
                 # Read both sensors
                 readings = self.read_sensors()
                 if readings['ph'] is not None or readings['ec'] is not None:
-                    logger.debug(f"Sensor readings - pH: {readings['ph']}, EC: {readings['ec']}")
+                    logger.debug("Sensor readings - pH: %s, EC: %s", readings['ph'], readings['ec'])
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
 
-            # Sleep for the monitoring interval
-            time.sleep(self.monitoring_interval)
+            # Sleep for the monitoring interval; stop_monitoring() wakes it early
+            stop_event.wait(self.monitoring_interval)
 
         logger.info("Sensor monitoring loop stopped")
 
@@ -195,15 +336,18 @@ class EZOSensorController:
 
         self.monitoring_active = True
 
-        # Start background monitoring thread
+        # Start background monitoring thread. Each run gets its own stop
+        # event, so a quick stop/start can never revive a previous loop.
+        self._monitoring_stop = threading.Event()
         self.monitoring_thread = threading.Thread(
             target=self._monitoring_loop,
+            args=(self._monitoring_stop,),
             daemon=True,
             name="EZO-Monitoring"
         )
         self.monitoring_thread.start()
 
-        logger.info(f"EZO pH/EC monitoring started (polling every {self.monitoring_interval}s)")
+        logger.info("EZO pH/EC monitoring started (polling every %ss)", self.monitoring_interval)
         return True
 
     def stop_monitoring(self):
@@ -213,6 +357,7 @@ class EZOSensorController:
             return True
 
         self.monitoring_active = False
+        self._monitoring_stop.set()
 
         # Wait for monitoring thread to finish
         if self.monitoring_thread and self.monitoring_thread.is_alive():
@@ -222,29 +367,41 @@ class EZOSensorController:
         return True
 
     def read_ph(self):
-        """Read pH value"""
-        response = self._send_command(EZO_PH_ADDRESS, "R")
+        """Read pH value (a reading younger than EZO_READ_CACHE_TTL is reused)"""
+        if self._is_fresh('ph'):
+            return self.latest_readings['ph']
+        return self._store_ph(self._send_command(EZO_PH_ADDRESS, "R"))
+    
+    def read_ec(self):
+        """Read EC value (returns mS/cm; cached like read_ph)"""
+        if self._is_fresh('ec'):
+            return self.latest_readings['ec']
+        return self._store_ec(self._send_command(EZO_EC_ADDRESS, "R"))
+    
+    def _is_fresh(self, key):
+        """Whether the cached reading for key is younger than EZO_READ_CACHE_TTL"""
+        return time.monotonic() - self._read_times[key] < EZO_READ_CACHE_TTL
+    
+    def _store_ph(self, response):
+        """Parse an "R" response from the pH circuit and cache it"""
         if response:
             try:
                 value = float(response)
-                self.latest_readings['ph'] = value
-                self.latest_readings['last_update'] = time.time()
+                self._update_reading('ph', value)
                 return value
             except ValueError:
                 logger.error(f"Invalid pH reading: {response}")
                 return None
         return None
     
-    def read_ec(self):
-        """Read EC value (returns mS/cm)"""
-        response = self._send_command(EZO_EC_ADDRESS, "R")
+    def _store_ec(self, response):
+        """Parse an "R" response from the EC circuit and cache it (mS/cm)"""
         if response:
             try:
                 # EZO returns μS/cm, convert to mS/cm
                 ec_us = float(response)
                 ec_ms = ec_us / 1000.0
-                self.latest_readings['ec'] = ec_ms
-                self.latest_readings['last_update'] = time.time()
+                self._update_reading('ec', ec_ms)
                 return ec_ms
             except ValueError:
                 logger.error(f"Invalid EC reading: {response}")
@@ -252,10 +409,22 @@ class EZOSensorController:
         return None
     
     def read_sensors(self):
-        """Read both sensors and return dict"""
-        ph = self.read_ph()
-        time.sleep(0.3)  # Small delay between readings
-        ec = self.read_ec()
+        """Read both sensors and return dict (recent readings are reused)"""
+        if self._is_fresh('ph') and self._is_fresh('ec'):
+            readings = self.latest_readings
+            return {
+                'ph': readings['ph'],
+                'ec': readings['ec'],
+                'timestamp': readings['last_update']
+            }
+        
+        # Both circuits process "R" at the same time; one shared wait
+        ph_response, ec_response = self._send_commands([
+            (EZO_PH_ADDRESS, "R", 0.9),
+            (EZO_EC_ADDRESS, "R", 0.9),
+        ])
+        ph = self._store_ph(ph_response)
+        ec = self._store_ec(ec_response)
         
         return {
             'ph': ph,
@@ -263,9 +432,40 @@ class EZOSensorController:
             'timestamp': time.time()
         }
     
+    def _update_reading(self, key, value):
+        """Publish a new reading by replacing latest_readings (see __init__)"""
+        with self._readings_lock:
+            self.latest_readings = {**self.latest_readings, key: value, 'last_update': time.time()}
+            self._read_times[key] = time.monotonic()
+    
+    def _invalidate_reading(self, address):
+        """Drop the cached reading's freshness for the circuit at address
+
+        Called after calibration commands so the next read_*() goes to the
+        circuit instead of returning a pre-calibration value.
+        """
+        with self._readings_lock:
+            self._read_times[_READING_KEYS[address]] = 0.0
+    
     def get_latest_readings(self):
-        """Get cached latest readings"""
-        return self.latest_readings.copy()
+        """Get cached latest readings
+
+        Returns the current snapshot without copying; it is replaced, never
+        modified, on the next reading, so treat it as read-only.
+        """
+        return self.latest_readings
+    
+    def _calibrate(self, address, command, description):
+        """Send a calibration command, logging and returning whether it was accepted"""
+        response = self._send_command(address, command, reply_length=_ACK_REPLY_LENGTH)
+        # Invalidate whatever the outcome: a failed command may still have
+        # changed the circuit's calibration
+        self._invalidate_reading(address)
+        if response is not None:
+            logger.info("%s: Success", description)
+            return True
+        logger.error(f"{description}: Failed")
+        return False
     
     # ========================================================================
     # pH Calibration Methods
@@ -273,52 +473,27 @@ class EZOSensorController:
     
     def calibrate_ph_mid(self, value=None):
         """Calibrate pH mid-point (typically 7.0)"""
-        if value is None:
-            value = PH_CALIBRATION_SOLUTIONS['mid']
-
-        command = f"Cal,mid,{value:.2f}"
-        response = self._send_command(EZO_PH_ADDRESS, command)
-        
-        if response is not None:
-            logger.info(f"pH mid calibration at {value:.2f}: Success")
-            return True
-        else:
-            logger.error(f"pH mid calibration at {value:.2f}: Failed")
-            return False
+        return self._calibrate_ph_point('mid', value)
     
     def calibrate_ph_low(self, value=None):
         """Calibrate pH low-point (typically 4.0)"""
-        if value is None:
-            value = PH_CALIBRATION_SOLUTIONS['low']
-
-        command = f"Cal,low,{value:.2f}"
-        response = self._send_command(EZO_PH_ADDRESS, command)
-
-        if response is not None:
-            logger.info(f"pH low calibration at {value:.2f}: Success")
-            return True
-        else:
-            logger.error(f"pH low calibration at {value:.2f}: Failed")
-            return False
+        return self._calibrate_ph_point('low', value)
 
     def calibrate_ph_high(self, value=None):
         """Calibrate pH high-point (typically 10.0)"""
-        if value is None:
-            value = PH_CALIBRATION_SOLUTIONS['high']
-
-        command = f"Cal,high,{value:.2f}"
-        response = self._send_command(EZO_PH_ADDRESS, command)
+        return self._calibrate_ph_point('high', value)
 
-        if response is not None:
-            logger.info(f"pH high calibration at {value:.2f}: Success")
-            return True
-        else:
-            logger.error(f"pH high calibration at {value:.2f}: Failed")
-            return False
+    def _calibrate_ph_point(self, point, value):
+        """Calibrate a pH point ('mid'/'low'/'high'), defaulting to its config solution"""
+        if value is None:
+            value = PH_CALIBRATION_SOLUTIONS[point]
+        return self._calibrate(EZO_PH_ADDRESS, f"Cal,{point},{value:.2f}",
+                               f"pH {point} calibration at {value:.2f}")
 
     def clear_ph_calibration(self):
         """Clear all pH calibration"""
-        response = self._send_command(EZO_PH_ADDRESS, "Cal,clear")
+        response = self._send_command(EZO_PH_ADDRESS, "Cal,clear", reply_length=_ACK_REPLY_LENGTH)
+        self._invalidate_reading(EZO_PH_ADDRESS)
 
         if response is not None:
             logger.info("pH calibration cleared")
@@ -329,13 +504,7 @@ class EZOSensorController:
 
     def get_ph_calibration_status(self):
         """Get number of pH calibration points (0-3)"""
-        response = self._send_command(EZO_PH_ADDRESS, "Cal,?")
-        if response:
-            try:
-                return int(response.split(',')[1])
-            except:
-                return None
-        return None
+        return self._parse_calibration(self._send_command(EZO_PH_ADDRESS, "Cal,?"))
     
     # ========================================================================
     # EC Calibration Methods
@@ -343,63 +512,32 @@ class EZOSensorController:
     
     def calibrate_ec_dry(self):
         """Calibrate EC dry (in air)"""
-        response = self._send_command(EZO_EC_ADDRESS, "Cal,dry")
-        
-        if response is not None:
-            logger.info("EC dry calibration: Success")
-            return True
-        else:
-            logger.error("EC dry calibration: Failed")
-            return False
+        return self._calibrate(EZO_EC_ADDRESS, "Cal,dry", "EC dry calibration")
     
     def calibrate_ec_single(self, value=None):
         """Single-point EC calibration (typically 1413 μS/cm)"""
-        if value is None:
-            value = EC_CALIBRATION_SOLUTIONS['single']
-
-        command = f"Cal,{value}"
-        response = self._send_command(EZO_EC_ADDRESS, command)
-
-        if response is not None:
-            logger.info(f"EC single calibration at {value} μS/cm: Success")
-            return True
-        else:
-            logger.error(f"EC single calibration at {value} μS/cm: Failed")
-            return False
+        return self._calibrate_ec_point('single', value)
 
     def calibrate_ec_low(self, value=None):
         """Two-point EC calibration - low (typically 84 μS/cm)"""
-        if value is None:
-            value = EC_CALIBRATION_SOLUTIONS['low']
-
-        command = f"Cal,low,{value}"
-        response = self._send_command(EZO_EC_ADDRESS, command)
-
-        if response is not None:
-            logger.info(f"EC low calibration at {value} μS/cm: Success")
-            return True
-        else:
-            logger.error(f"EC low calibration at {value} μS/cm: Failed")
-            return False
+        return self._calibrate_ec_point('low', value)
 
     def calibrate_ec_high(self, value=None):
         """Two-point EC calibration - high (typically 1413 μS/cm)"""
-        if value is None:
-            value = EC_CALIBRATION_SOLUTIONS['high']
-
-        command = f"Cal,high,{value}"
-        response = self._send_command(EZO_EC_ADDRESS, command)
+        return self._calibrate_ec_point('high', value)
 
-        if response is not None:
-            logger.info(f"EC high calibration at {value} μS/cm: Success")
-            return True
-        else:
-            logger.error(f"EC high calibration at {value} μS/cm: Failed")
-            return False
+    def _calibrate_ec_point(self, point, value):
+        """Calibrate an EC point ('single'/'low'/'high'), defaulting to its config solution"""
+        if value is None:
+            value = EC_CALIBRATION_SOLUTIONS[point]
+        # Single-point calibration is a bare "Cal,<value>"
+        command = f"Cal,{value}" if point == 'single' else f"Cal,{point},{value}"
+        return self._calibrate(EZO_EC_ADDRESS, command, f"EC {point} calibration at {value} μS/cm")
 
     def clear_ec_calibration(self):
         """Clear all EC calibration"""
-        response = self._send_command(EZO_EC_ADDRESS, "Cal,clear")
+        response = self._send_command(EZO_EC_ADDRESS, "Cal,clear", reply_length=_ACK_REPLY_LENGTH)
+        self._invalidate_reading(EZO_EC_ADDRESS)
 
         if response is not None:
             logger.info("EC calibration cleared")
@@ -410,11 +548,23 @@ class EZOSensorController:
 
     def get_ec_calibration_status(self):
         """Get EC calibration state (0=none, 1=single, 2=dual)"""
-        response = self._send_command(EZO_EC_ADDRESS, "Cal,?")
+        return self._parse_calibration(self._send_command(EZO_EC_ADDRESS, "Cal,?"))
+    
+    def get_calibration_statuses(self):
+        """Get (pH points, EC state) with one shared EZO processing wait"""
+        ph_response, ec_response = self._send_commands([
+            (EZO_PH_ADDRESS, "Cal,?", 0.9),
+            (EZO_EC_ADDRESS, "Cal,?", 0.9),
+        ])
+        return self._parse_calibration(ph_response), self._parse_calibration(ec_response)
+    
+    @staticmethod
+    def _parse_calibration(response):
+        """Parse a "?CAL,n" reply to n, or None"""
         if response:
             try:
-                return int(response.split(',')[1])
-            except:
+                return int(response.split(',', 2)[1])
+            except (IndexError, ValueError):
                 return None
         return None
     
@@ -471,22 +621,27 @@ class MockEZOSensorController(EZOSensorController):
             self.stop_monitoring()
         self.connected = False
 
-    def _send_command(self, address, command, response_time=0.9):
+    def _send_command(self, address, command, response_time=0.9, reply_length=_REPLY_LENGTH):
         # Generic success so inherited calibration methods report success.
         return "OK"
 
+    def read_sensors(self):
+        return {
+            'ph': self.read_ph(),
+            'ec': self.read_ec(),
+            'timestamp': time.time()
+        }
+
     def read_ph(self):
         import random
         value = round(self._base_ph + random.uniform(-0.1, 0.1), 2)
-        self.latest_readings['ph'] = value
-        self.latest_readings['last_update'] = time.time()
+        self._update_reading('ph', value)
         return value
 
     def read_ec(self):
         import random
         value = round(self._base_ec + random.uniform(-0.05, 0.05), 3)
-        self.latest_readings['ec'] = value
-        self.latest_readings['last_update'] = time.time()
+        self._update_reading('ec', value)
         return value
 
     def get_ph_calibration_status(self):
@@ -495,6 +650,9 @@ class MockEZOSensorController(EZOSensorController):
     def get_ec_calibration_status(self):
         return self._ec_cal_state
 
+    def get_calibration_statuses(self):
+        return self._ph_cal_points, self._ec_cal_state
+
     def get_sensor_info(self):
         return {
             'ph': {'info': 'Mock pH EZO', 'calibration': self._ph_cal_points},
@@ -13,11 +13,11 @@ from config import (
     FLOW_METER_CALIBRATION,
     FLOW_METER_INTERRUPT_EDGE,
     FLOW_PULSE_DEBOUNCE_SECONDS,
+    FLOW_PULSE_GLITCH_FILTER_US,
     MOCK_FLOW_PULSE_INTERVAL,
     MOCK_PULSES_PER_INTERVAL,
     get_flow_meter_name,
-    get_available_flow_meters,
-    validate_flow_meter_id
+    get_available_flow_meters
 )
 
 import platform
@@ -43,6 +43,9 @@ class FlowMeterController:
         # Will store flow pins with callback info
         self.flow_pins = {}
         
+        # Meter IDs and names are fixed by config; resolve the names once
+        self._names = {meter_id: get_flow_meter_name(meter_id) for meter_id in self.flow_pins_map}
+        
         # Flow meter data
         self.flow_meters = {}
         for meter_id in self.flow_pins_map.keys():
@@ -62,6 +65,7 @@ class FlowMeterController:
         
         # GPIO handle
         self.h = None
+        self._closed = False
         
         # Setup GPIO
         self.setup_gpio()
@@ -72,29 +76,40 @@ class FlowMeterController:
             # Create an lgpio handle
             self.h = lgpio.gpiochip_open(0)
             
+            # GPIO -> (meter_id, meter state) for the shared edge callback
+            self._pin_meters = {}
+            
+            # Interrupt edge is the same for every meter
+            edge = lgpio.FALLING_EDGE if FLOW_METER_INTERRUPT_EDGE == "FALLING" else lgpio.RISING_EDGE
+
             # Setup flow meter pins with pull-up resistors and edge detection
             for meter_id, pin in self.flow_pins_map.items():
-                # Determine interrupt edge
-                edge = lgpio.FALLING_EDGE if FLOW_METER_INTERRUPT_EDGE == "FALLING" else lgpio.RISING_EDGE
-
                 # Use gpio_claim_alert instead of gpio_claim_input
                 # gpio_claim_alert enables kernel edge detection required for callbacks
                 lgpio.gpio_claim_alert(self.h, pin, edge, lgpio.SET_PULL_UP)
 
-                # Add callback for interrupt (fix lambda closure issue)
-                def make_callback(m_id):
-                    return lambda chip, gpio, level, tick: self.pulse_interrupt(m_id)
-
-                callback_id = lgpio.callback(self.h, pin, edge, make_callback(meter_id))
+                # Let the kernel drop bounce/EMI glitches before they reach the
+                # callback; without kernel support the software debounce in
+                # _count_pulse still applies
+                if FLOW_PULSE_GLITCH_FILTER_US:
+                    try:
+                        lgpio.gpio_set_debounce_micros(self.h, pin, FLOW_PULSE_GLITCH_FILTER_US)
+                    except Exception as e:
+                        logger.warning(f"Kernel debounce unavailable on GPIO {pin}, using software debounce: {e}")
+
+                # Every pin shares one bound-method callback that finds its
+                # meter from the reported GPIO (no per-pin closure)
+                self._pin_meters[pin] = (meter_id, self.flow_meters[meter_id])
+                callback_id = lgpio.callback(self.h, pin, edge, self._on_edge)
                 
                 # Store the callback info
                 self.flow_pins[meter_id] = {
                     'pin': pin,
                     'cb_id': callback_id,
-                    'name': get_flow_meter_name(meter_id)
+                    'name': self._names[meter_id]
                 }
                 
-                logger.debug(f"Flow meter {meter_id} ({get_flow_meter_name(meter_id)}) setup on GPIO {pin}")
+                logger.debug("Flow meter %s (%s) setup on GPIO %s", meter_id, self._names[meter_id], pin)
                 
             logger.info(f"Initialized {len(self.flow_pins)} flow meters")
             
@@ -102,48 +117,61 @@ class FlowMeterController:
             logger.error(f"Failed to setup flow meter GPIO: {e}")
             raise
     
+    def _on_edge(self, chip, gpio, level, tick):
+        """lgpio edge callback: count the pulse on the meter wired to gpio
+
+        The kernel tick's origin is kernel-dependent (uptime on current
+        kernels), so pulses are stamped with time.time() like
+        pulse_interrupt to keep last_pulse_time in epoch seconds.
+        """
+        meter_id, meter = self._pin_meters[gpio]
+        self._count_pulse(meter_id, meter, time.time())
+    
     def pulse_interrupt(self, meter_id):
         """Handle pulse interrupt from flow meter with debouncing"""
-        if meter_id in self.flow_meters:
-            meter = self.flow_meters[meter_id]
-            current_time = time.time()
-
-            # Debouncing: ignore pulses arriving closer together than the
-            # configured window (rejects relay EMI / mechanical bounce). This
-            # MUST stay below the real inter-pulse interval at max flow — the
-            # old 50ms value was longer than the ~41ms spacing at 6.6 gpm, so it
-            # dropped every other pulse and halved both rate and gallon count.
-            if current_time - meter['last_pulse_time'] < FLOW_PULSE_DEBOUNCE_SECONDS:
-                return
-
-            meter['pulse_count'] += 1
-
-            # Calculate pulse rate (for flow rate calculation)
-            time_diff = current_time - meter['last_pulse_time']
-            if time_diff > 0 and meter['last_pulse_time'] > 0:
-                # Exponential moving average for smooth rate calculation
-                new_rate = 1.0 / time_diff  # pulses per second
-                meter['pulse_rate'] = 0.7 * meter['pulse_rate'] + 0.3 * new_rate
-
-                # Calculate flow rate in gallons per minute
-                if meter['pulses_per_gallon'] > 0:
-                    meter['flow_rate'] = (meter['pulse_rate'] * 60) / meter['pulses_per_gallon']
-
-            meter['last_pulse_time'] = current_time
-
-            # Only log when actively monitoring flow (reduces noise from EMI)
-            if meter['status'] == 1:
-                # Log every 10th pulse during active flow
-                if meter['pulse_count'] % 10 == 0 or meter['pulse_count'] < 10:
-                    meter_name = get_flow_meter_name(meter_id)
-                    logger.info(f"{meter_name}: {meter['pulse_count']} pulses, "
-                               f"{meter['flow_rate']:.2f} GPM")
+        meter = self.flow_meters.get(meter_id)
+        if meter is not None:
+            self._count_pulse(meter_id, meter, time.time())
         else:
             logger.error(f"Pulse received for unknown meter ID: {meter_id}")
     
+    def _count_pulse(self, meter_id, meter, current_time):
+        """Count one edge on meter at current_time (a time.time() value), with debouncing"""
+        # Debouncing: ignore pulses arriving closer together than the
+        # configured window (rejects relay EMI / mechanical bounce). This
+        # MUST stay below the real inter-pulse interval at max flow — the
+        # old 50ms value was longer than the ~41ms spacing at 6.6 gpm, so it
+        # dropped every other pulse and halved both rate and gallon count.
+        last_pulse_time = meter['last_pulse_time']
+        time_diff = current_time - last_pulse_time
+        if time_diff < FLOW_PULSE_DEBOUNCE_SECONDS:
+            return
+
+        meter['pulse_count'] += 1
+
+        # Calculate pulse rate (for flow rate calculation)
+        if time_diff > 0 and last_pulse_time > 0:
+            # Exponential moving average for smooth rate calculation
+            new_rate = 1.0 / time_diff  # pulses per second
+            pulse_rate = meter['pulse_rate'] = 0.7 * meter['pulse_rate'] + 0.3 * new_rate
+
+            # Calculate flow rate in gallons per minute
+            pulses_per_gallon = meter['pulses_per_gallon']
+            if pulses_per_gallon > 0:
+                meter['flow_rate'] = (pulse_rate * 60) / pulses_per_gallon
+
+        meter['last_pulse_time'] = current_time
+
+        # Only log when actively monitoring flow (reduces noise from EMI)
+        if meter['status'] == 1:
+            # Log every 10th pulse during active flow
+            if meter['pulse_count'] % 10 == 0 or meter['pulse_count'] < 10:
+                logger.info("%s: %d pulses, %.2f GPM",
+                            self._names[meter_id], meter['pulse_count'], meter['flow_rate'])
+    
     def start_flow(self, meter_id, target_gallons, pulses_per_gallon=None):
         """Start flow monitoring"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             available = get_available_flow_meters()
             logger.error(f"Invalid flow meter ID: {meter_id} (available: {available})")
             return False
@@ -171,30 +199,41 @@ class FlowMeterController:
 
         meter['last_update'] = time.time()
         
-        meter_name = get_flow_meter_name(meter_id)
-        logger.info(f"Started {meter_name}: target {target_gallons} gallons, "
-                   f"{meter['pulses_per_gallon']} pulses/gallon")
+        logger.info("Started %s: target %s gallons, %s pulses/gallon",
+                    self._names[meter_id], target_gallons, meter['pulses_per_gallon'])
         return True
     
     def stop_flow(self, meter_id):
         """Stop flow monitoring"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return False
         
         meter = self.flow_meters[meter_id]
         meter['status'] = 0  # Inactive
         
-        meter_name = get_flow_meter_name(meter_id)
-        logger.info(f"Stopped {meter_name}")
+        logger.info("Stopped %s", self._names[meter_id])
         return True
     
     def update_flow_status(self, meter_id):
         """Update flow meter status and check for completion"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return False
 
-        meter = self.flow_meters[meter_id]
+        return self._update_meter(meter_id, self.flow_meters[meter_id])
+    
+    def update_all_flow_status(self):
+        """Update every flow meter in one pass
 
+        Returns:
+            dict: meter_id -> live meter state dict (read-only for callers)
+        """
+        for meter_id, meter in self.flow_meters.items():
+            if meter['status'] == 1:
+                self._update_meter(meter_id, meter)
+        return self.flow_meters
+    
+    def _update_meter(self, meter_id, meter):
+        """Fold new pulses into meter's gallon count; returns whether it is still active"""
         # Skip if meter is not active (0=inactive, 2=completed)
         if meter['status'] != 1:
             return False
@@ -209,30 +248,28 @@ class FlowMeterController:
                 meter['current_gallons'] = new_gallons
                 meter['last_update'] = time.time()
 
-                meter_name = get_flow_meter_name(meter_id)
-                logger.debug(f"{meter_name}: {meter['current_gallons']}/{meter['target_gallons']} gallons "
-                           f"({meter['flow_rate']:.2f} GPM)")
+                meter_name = self._names[meter_id]
+                logger.debug("%s: %s/%s gallons (%.2f GPM)", meter_name,
+                             meter['current_gallons'], meter['target_gallons'], meter['flow_rate'])
 
                 # Check if target reached
                 if meter['target_gallons'] <= meter['current_gallons']:
                     meter['status'] = 2  # Completed (not inactive, so we can track completion)
-                    logger.info(f"{meter_name} completed: {meter['current_gallons']} gallons")
+                    logger.info("%s completed: %s gallons", meter_name, meter['current_gallons'])
                     return False  # Completed
 
         return meter['status'] == 1  # Still active
     
     def get_flow_status(self, meter_id):
         """Get flow meter status"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return None
 
-        status = self.flow_meters[meter_id].copy()
-        status['name'] = get_flow_meter_name(meter_id)
-        return status
+        return {**self.flow_meters[meter_id], 'name': self._names[meter_id]}
 
     def is_completed_and_unnotified(self, meter_id):
         """Check if flow meter completed but hasn't been notified yet"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return False
 
         meter = self.flow_meters[meter_id]
@@ -240,7 +277,7 @@ class FlowMeterController:
 
     def mark_completion_notified(self, meter_id):
         """Mark that completion notification has been sent"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return False
 
         meter = self.flow_meters[meter_id]
@@ -250,28 +287,33 @@ class FlowMeterController:
         return False
     
     def get_all_flow_status(self):
-        """Get status of all flow meters"""
-        status = {}
-        for meter_id in self.flow_meters.keys():
-            status[meter_id] = self.get_flow_status(meter_id)
-        return status
+        """Get status of all flow meters
+
+        Returns snapshots (the result goes into the JSON system status), each
+        built in one step rather than via get_flow_status() per meter. For
+        read-only use inside the process, update_all_flow_status() returns
+        the live states without copying.
+        """
+        names = self._names
+        return {meter_id: {**meter, 'name': names[meter_id]}
+                for meter_id, meter in self.flow_meters.items()}
     
     def calibrate_flow_meter(self, meter_id, pulses_per_gallon):
         """Set calibration for flow meter"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return False
         
         if pulses_per_gallon <= 0:
             return False
         
         self.flow_meters[meter_id]['pulses_per_gallon'] = pulses_per_gallon
-        meter_name = get_flow_meter_name(meter_id)
+        meter_name = self._names[meter_id]
         logger.info(f"Calibrated {meter_name}: {pulses_per_gallon} pulses/gallon")
         return True
     
     def reset_flow_meter(self, meter_id):
         """Reset flow meter counters"""
-        if not validate_flow_meter_id(meter_id):
+        if meter_id not in self.flow_meters:
             return False
         
         meter = self.flow_meters[meter_id]
@@ -281,7 +323,7 @@ class FlowMeterController:
         meter['target_gallons'] = 0
         meter['status'] = 0
         
-        meter_name = get_flow_meter_name(meter_id)
+        meter_name = self._names[meter_id]
         logger.info(f"Reset {meter_name}")
         return True
     
@@ -292,7 +334,10 @@ class FlowMeterController:
         logger.warning("Emergency stop - all flow meters stopped")
     
     def cleanup(self):
-        """Clean up GPIO resources"""
+        """Clean up GPIO resources (safe to call more than once)"""
+        if self._closed:
+            return
+        self._closed = True
         try:
             self.emergency_stop()
             
@@ -316,12 +361,12 @@ class FlowMeterController:
         except Exception as e:
             logger.error(f"Error during flow meter cleanup: {e}")
     
-    def __del__(self):
-        """Destructor - ensure cleanup"""
-        try:
-            self.cleanup()
-        except:
-            pass
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.cleanup()
+        return False
 
 
 # Mock version for testing without actual hardware
@@ -331,6 +376,7 @@ class MockFlowMeterController(FlowMeterController):
     def __init__(self):
         # Use flow meter mappings from config
         self.flow_pins_map = FLOW_METER_GPIO_PINS.copy()
+        self._names = {meter_id: get_flow_meter_name(meter_id) for meter_id in self.flow_pins_map}
         self.flow_pins = {}
         self.flow_meters = {}
         
@@ -352,10 +398,14 @@ class MockFlowMeterController(FlowMeterController):
             self.flow_pins[meter_id] = {
                 'pin': self.flow_pins_map[meter_id],
                 'cb_id': None,
-                'name': get_flow_meter_name(meter_id)
+                'name': self._names[meter_id]
             }
         
-        self.last_mock_time = time.time()
+        # Mock pulse clock: monotonic integer ns, so wall-clock adjustments
+        # cannot skip or replay intervals and the remainder carries exactly
+        self._mock_interval_ns = int(MOCK_FLOW_PULSE_INTERVAL * 1e9)
+        self.last_mock_time = time.monotonic_ns()
+        self._closed = False
         logger.info("Mock flow meter controller initialized")
     
     def setup_gpio(self):
@@ -364,18 +414,17 @@ class MockFlowMeterController(FlowMeterController):
     
     def cleanup(self):
         """Mock cleanup"""
-        pass
+        self._closed = True
     
     def update_mock_pulses(self):
         """Generate mock pulses for testing, catching up on missed intervals"""
-        current_time = time.time()
-        elapsed = current_time - self.last_mock_time
+        elapsed = time.monotonic_ns() - self.last_mock_time
 
         # Calculate how many intervals have passed since last update
-        if elapsed >= MOCK_FLOW_PULSE_INTERVAL:
-            intervals = int(elapsed / MOCK_FLOW_PULSE_INTERVAL)
+        if elapsed >= self._mock_interval_ns:
+            intervals = elapsed // self._mock_interval_ns
             # Advance by exact interval count to preserve fractional remainder
-            self.last_mock_time += intervals * MOCK_FLOW_PULSE_INTERVAL
+            self.last_mock_time += intervals * self._mock_interval_ns
 
             # Add accumulated pulses to active flow meters
             for meter_id, meter in self.flow_meters.items():
@@ -386,6 +435,11 @@ class MockFlowMeterController(FlowMeterController):
         """Update with mock pulse generation"""
         self.update_mock_pulses()
         return super().update_flow_status(meter_id)
+    
+    def update_all_flow_status(self):
+        """Update all meters with one round of mock pulse generation"""
+        self.update_mock_pulses()
+        return super().update_all_flow_status()
 
 
 # Test code
@@ -393,43 +447,40 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     
     # Use mock controller for testing without hardware
-    controller = MockFlowMeterController()
-    
-    print("Flow Meter Controller Test (Using config.py)")
-    print("=" * 50)
-    print("Available flow meters:")
-    
-    for meter_id in get_available_flow_meters():
-        status = controller.get_flow_status(meter_id)
-        if status:
-            gpio_pin = FLOW_METER_GPIO_PINS[meter_id]
-            print(f"  {meter_id}. {status['name']:20s} (GPIO {gpio_pin}): {status['pulses_per_gallon']} PPG")
-    
-    print("\nTesting flow monitoring...")
-    test_meter = get_available_flow_meters()[0] if get_available_flow_meters() else None
-    
-    if test_meter:
-        meter_name = get_flow_meter_name(test_meter)
-        print(f"Starting {meter_name} for 5 gallons...")
-        
-        if controller.start_flow(test_meter, 5):
-            print("Flow monitoring started")
-            
-            # Monitor progress
-            for i in range(30):  # 30 iterations
-                still_running = controller.update_flow_status(test_meter)
-                status = controller.get_flow_status(test_meter)
-                print(f"  Progress: {status['current_gallons']}/{status['target_gallons']} gallons "
-                      f"({status['pulse_count']} pulses)")
-                
-                if not still_running:
-                    print("  Flow completed!")
-                    break
-                
-                time.sleep(0.5)
+    with MockFlowMeterController() as controller:
+        print("Flow Meter Controller Test (Using config.py)")
+        print("=" * 50)
+        print("Available flow meters:")
+
+        for meter_id in get_available_flow_meters():
+            status = controller.get_flow_status(meter_id)
+            if status:
+                gpio_pin = FLOW_METER_GPIO_PINS[meter_id]
+                print(f"  {meter_id}. {status['name']:20s} (GPIO {gpio_pin}): {status['pulses_per_gallon']} PPG")
+
+        print("\nTesting flow monitoring...")
+        test_meter = get_available_flow_meters()[0] if get_available_flow_meters() else None
+
+        if test_meter:
+            meter_name = get_flow_meter_name(test_meter)
+            print(f"Starting {meter_name} for 5 gallons...")
+
+            if controller.start_flow(test_meter, 5):
+                print("Flow monitoring started")
+
+                # Monitor progress
+                for i in range(30):  # 30 iterations
+                    still_running = controller.update_flow_status(test_meter)
+                    status = controller.get_flow_status(test_meter)
+                    print(f"  Progress: {status['current_gallons']}/{status['target_gallons']} gallons "
+                          f"({status['pulse_count']} pulses)")
+
+                    if not still_running:
+                        print("  Flow completed!")
+                        break
+
+                    time.sleep(0.5)
+            else:
+                print("Failed to start flow monitoring")
         else:
-            print("Failed to start flow monitoring")
-    else:
-        print("No flow meters available for testing")
-    
-    controller.cleanup()
\ No newline at end of file
+            print("No flow meters available for testing")
\ No newline at end of file
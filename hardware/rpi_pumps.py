@@ -9,12 +9,17 @@ Works independently without hardware manager - compatible with simple_gui.py pat
 import time
 import threading
 import logging
+from contextlib import ExitStack
+from functools import lru_cache
+from types import MappingProxyType
 from config import (
     PUMP_ADDRESSES,
     PUMP_NAMES,
     I2C_BUS_NUMBER,
     I2C_DEFAULT_ADDRESS,
     EZO_COMMAND_DELAY,
+    EZO_POLL_INTERVAL,
+    PUMP_STATUS_MIN_INTERVAL,
     EZO_MAX_RETRIES,
     EZO_RETRY_DELAY,
     EZO_RESPONSE_CODES,
@@ -41,6 +46,23 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Bytes outside printable ASCII; stripped from EZO replies via bytes.translate
+_NONPRINTABLE = bytes(b for b in range(256) if not 32 <= b <= 126)
+
+# SMBus block transfers carry at most 32 data bytes after the command byte
+_I2C_BLOCK_MAX = 32
+
+
+@lru_cache(maxsize=128)
+def _encode_command(command):
+    """Encode an EZO command once: (raw bytes, first byte, remaining bytes list)
+
+    The same few commands ("R", "Cal,?", "X", "D,<ml>") are sent over and
+    over; the returned list is only read by smbus2, so sharing it is safe.
+    """
+    command_bytes = command.encode()
+    return command_bytes, command_bytes[0], list(command_bytes[1:])
+
 class EZOPumpController:
     def __init__(self, bus_number=None, i2c_lock=None):
         """Initialize EZO Pump Controller
@@ -55,6 +77,9 @@ class EZOPumpController:
         self.bus_number = bus_number or I2C_BUS_NUMBER
         self.bus = None
         self._i2c_lock = i2c_lock or threading.Lock()
+        self._read_msgs = {}  # address -> reusable 32-byte read i2c_msg
+        # Per-pump transaction locks (see send_command)
+        self._address_locks = {address: threading.Lock() for address in PUMP_ADDRESSES.values()}
         
         # Pump information storage
         self.pump_info = {}
@@ -74,6 +99,8 @@ class EZOPumpController:
                 'last_error': '',
                 'connected': False
             }
+        # Read-only live views of pump_info (the per-pump dicts are never replaced)
+        self._status_view = {pump_id: MappingProxyType(info) for pump_id, info in self.pump_info.items()}
         
         # Voltage polling control - DISABLED to prevent interference with dispenses
         self.voltage_poll_interval = 60.0  # Poll voltage every minute
@@ -114,45 +141,33 @@ class EZOPumpController:
         retries = 0
         while retries < EZO_MAX_RETRIES:
             try:
-                # Hold the shared bus lock for the whole write->wait->read
-                # transaction so a sensor read on the same physical bus cannot
-                # interleave between this pump's write and its read-back.
-                with self._i2c_lock:
-                    # Send command using raw I2C (equivalent to Arduino Wire library)
-                    msg = smbus2.i2c_msg.write(address, list(command.encode()))
-                    self.bus.i2c_rdwr(msg)
+                # The pump's address lock covers the whole write->wait->read
+                # transaction, so no other command to this pump can slip in
+                # and take its reply. The shared bus lock is only held for
+                # each individual transfer: the bus is idle while the pump
+                # processes, and other devices may use it meanwhile.
+                with self._address_locks[address]:
+                    with self._i2c_lock:
+                        self._write_command(address, command)
 
-                    # Wait for processing
-                    time.sleep(delay)
-
-                    # Read response
-                    msg = smbus2.i2c_msg.read(address, 32)
-                    self.bus.i2c_rdwr(msg)
-
-                    data = list(msg)
+                    # Poll for the response instead of always sleeping the
+                    # full delay: the pump answers 254 (still processing)
+                    # until it is done, so stop at the first other code and
+                    # treat `delay` as the upper bound.
+                    deadline = time.monotonic() + delay
+                    while True:
+                        time.sleep(EZO_POLL_INTERVAL)
+                        with self._i2c_lock:
+                            data = self._read_reply(address)
+                        if not data or data[0] != 254 or time.monotonic() >= deadline:
+                            break
                 
                 # Parse response
-                if len(data) > 0:
-                    response_code = data[0]
-                    
-                    if response_code == 1:  # Success
-                        response_text = ''.join([chr(x) for x in data[1:] if 32 <= x <= 126]).strip()
-                        logger.debug(f"Pump {pump_id} ({command}): {response_text}")
-                        self.pump_info[pump_id]['connected'] = True
-                        self.pump_info[pump_id]['last_error'] = ''
-                        return response_text
-                    elif response_code == 254:  # Still processing
-                        retries += 1
-                        time.sleep(EZO_RETRY_DELAY)
-                        continue
-                    else:
-                        error_msg = EZO_RESPONSE_CODES.get(response_code, f"Unknown error: {response_code}")
-                        logger.warning(f"Pump {pump_id} error: {error_msg}")
-                        self.pump_info[pump_id]['last_error'] = error_msg
-                        return None
-                else:
-                    logger.warning(f"Pump {pump_id}: No response data")
-                    return None
+                if len(data) > 0 and data[0] == 254:  # Still processing
+                    retries += 1
+                    time.sleep(EZO_RETRY_DELAY)
+                    continue
+                return self._decode_reply(pump_id, command, data)
                 
             except Exception as e:
                 retries += 1
@@ -166,6 +181,124 @@ class EZOPumpController:
         
         return None
     
+    def send_commands(self, batch, delay=None):
+        """Send one command to each of several pumps, sharing the processing wait
+
+        Every command is written first, then all pumps are polled together
+        until each has answered or `delay` runs out, so a sweep such as
+        "Cal,?" to every pump costs about one pump's processing time instead
+        of one per pump. There are no retries: a pump that fails or is still
+        busy at the deadline gets None, and callers fall back to
+        send_command() for it. Both calibration sweeps use this:
+        _check_all_calibrations() and
+        HardwareComms.check_pump_calibrations_batch().
+
+        Args:
+            batch: Sequence of (pump_id, command) tuples, one per pump
+            delay: Upper bound on the shared wait (defaults to EZO_COMMAND_DELAY)
+
+        Returns:
+            List of response strings (None for a failed command), in batch order
+        """
+        responses = [None] * len(batch)
+        if not self.bus:
+            logger.error("I2C bus not initialized")
+            return responses
+        
+        valid = [i for i, (pump_id, _) in enumerate(batch) if validate_pump_id(pump_id)]
+        delay = delay or EZO_COMMAND_DELAY
+        
+        # Same locking as send_command; address locks in address order so
+        # overlapping batches cannot deadlock.
+        with ExitStack() as stack:
+            for address in sorted({PUMP_ADDRESSES[batch[i][0]] for i in valid}):
+                stack.enter_context(self._address_locks[address])
+            
+            pending = []
+            with self._i2c_lock:
+                for i in valid:
+                    pump_id, command = batch[i]
+                    try:
+                        self._write_command(PUMP_ADDRESSES[pump_id], command)
+                        pending.append(i)
+                    except Exception as e:
+                        logger.warning(f"Pump {pump_id} ({command}) write failed: {e}")
+            
+            deadline = time.monotonic() + delay
+            while pending:
+                time.sleep(EZO_POLL_INTERVAL)
+                expired = time.monotonic() >= deadline
+                still_busy = []
+                for i in pending:
+                    pump_id, command = batch[i]
+                    try:
+                        with self._i2c_lock:
+                            data = self._read_reply(PUMP_ADDRESSES[pump_id])
+                    except Exception as e:
+                        logger.warning(f"Pump {pump_id} ({command}) read failed: {e}")
+                        continue
+                    if data and data[0] == 254 and not expired:
+                        still_busy.append(i)
+                    else:
+                        responses[i] = self._decode_reply(pump_id, command, data)
+                pending = still_busy
+        
+        return responses
+    
+    def _decode_reply(self, pump_id, command, data):
+        """Turn a read-back into response text (code 1) or None, recording errors"""
+        if len(data) > 0:
+            response_code = data[0]
+            
+            if response_code == 1:  # Success
+                # The text ends at the first NUL; anything after it is stale
+                # buffer, not part of this reply
+                reply = data[1:].partition(b'\x00')[0]
+                response_text = reply.translate(None, _NONPRINTABLE).decode('ascii').strip()
+                logger.debug(f"Pump {pump_id} ({command}): {response_text}")
+                self.pump_info[pump_id]['connected'] = True
+                self.pump_info[pump_id]['last_error'] = ''
+                return response_text
+            else:
+                error_msg = EZO_RESPONSE_CODES.get(response_code, f"Unknown error: {response_code}")
+                logger.warning(f"Pump {pump_id} error: {error_msg}")
+                self.pump_info[pump_id]['last_error'] = error_msg
+                return None
+        else:
+            logger.warning(f"Pump {pump_id}: No response data")
+            return None
+    
+    def _write_command(self, address, command):
+        """Write a raw EZO command (no register byte) to the pump at address
+
+        The bytes on the wire are the same either way: short commands (all
+        the usual ones - "D,10", "Cal,?", "X") go out through the SMBus
+        block-write path, the first byte standing in as the "register", which
+        skips building an i2c_msg. Anything longer than an SMBus block falls
+        back to a raw i2c_rdwr write (equivalent to Arduino Wire library).
+        """
+        command_bytes, first, rest = _encode_command(command)
+        if not rest:
+            self.bus.write_byte(address, first)
+        elif len(rest) <= _I2C_BLOCK_MAX:
+            self.bus.write_i2c_block_data(address, first, rest)
+        else:
+            self.bus.i2c_rdwr(smbus2.i2c_msg.write(address, list(command_bytes)))
+    
+    def _read_reply(self, address):
+        """Read a 32-byte EZO reply from address; caller holds _i2c_lock
+
+        Each address keeps one read i2c_msg that is refilled on every poll
+        instead of allocating a fresh ctypes buffer. The address and bus locks
+        make the reuse safe, and bytes() (i2c_msg implements __bytes__) copies
+        the reply out before the bus lock is released.
+        """
+        msg = self._read_msgs.get(address)
+        if msg is None:
+            msg = self._read_msgs[address] = smbus2.i2c_msg.read(address, 32)
+        self.bus.i2c_rdwr(msg)
+        return bytes(msg)
+    
     def initialize_pumps(self):
         """Initialize all pumps and get their status"""
         logger.info("Initializing EZO pumps...")
@@ -209,14 +342,19 @@ class EZOPumpController:
         """Check calibration status for all pumps once and cache results"""
         logger.info("Checking pump calibration status...")
         
-        for pump_id in range(1, 9):  # Pumps 1-8
-            if pump_id not in PUMP_ADDRESSES:
-                continue
-                
+        # Query every pump in one batched sweep; a pump that misses it is
+        # asked again on its own below.
+        pump_ids = [pump_id for pump_id in range(1, 9) if pump_id in PUMP_ADDRESSES]  # Pumps 1-8
+        logger.info(f"Sending Cal,? to pumps {pump_ids}...")
+        swept = dict(zip(pump_ids, self.send_commands([(pump_id, "Cal,?") for pump_id in pump_ids])))
+        
+        for pump_id in pump_ids:
             try:
                 # Check calibration status - debug the full communication process
-                logger.info(f"Pump {pump_id}: Sending Cal,? command...")
-                cal_response = self.send_command(pump_id, "Cal,?")
+                cal_response = swept[pump_id]
+                if cal_response is None:
+                    logger.info(f"Pump {pump_id}: Sending Cal,? command...")
+                    cal_response = self.send_command(pump_id, "Cal,?")
                 
                 # Log exact response for debugging
                 if cal_response is None:
@@ -227,19 +365,9 @@ class EZOPumpController:
                     logger.info(f"Pump {pump_id}: Cal,? response = '{cal_response}' (length: {len(cal_response)})")
                 
                 if cal_response:
-                    # Parse calibration status - EZO pump Cal,? returns ?CAL,n (uppercase) where n is calibration status
-                    if cal_response.startswith("?CAL,"):
-                        try:
-                            cal_status = int(cal_response.split(',')[1])
-                            self.calibration_status[pump_id] = cal_status
-                            self.pump_info[pump_id]['calibrated'] = cal_status > 0
-                            logger.info(f"Pump {pump_id}: ✓ Calibration status {cal_status} ({'calibrated' if cal_status > 0 else 'uncalibrated'})")
-                        except (IndexError, ValueError) as e:
-                            logger.warning(f"Pump {pump_id}: Failed to parse calibration response '{cal_response}': {e}")
-                            self.calibration_status[pump_id] = 0
-                            self.pump_info[pump_id]['calibrated'] = False
-                    elif cal_response.startswith("?Cal,"):
-                        # Handle mixed case format too
+                    # Parse calibration status - EZO pump Cal,? returns ?CAL,n where n is calibration status
+                    # (firmware varies between ?CAL and ?Cal, so compare the prefix case-insensitively)
+                    if cal_response[:5].upper() == "?CAL,":
                         try:
                             cal_status = int(cal_response.split(',')[1])
                             self.calibration_status[pump_id] = cal_status
@@ -392,6 +520,10 @@ class EZOPumpController:
         if not self.pump_info[pump_id]['is_dispensing']:
             return False
         
+        # Polled faster than the volume can meaningfully change: skip the I2C read
+        if time.time() - self.pump_info[pump_id]['last_check'] < PUMP_STATUS_MIN_INTERVAL:
+            return True
+        
         # Get current dispensed volume
         response = self.send_command(pump_id, "R")
         
@@ -441,6 +573,34 @@ class EZOPumpController:
             return None
         
         return self.pump_info[pump_id].copy()
+
+    def get_pump_info_batch(self, pump_ids, fields=None):
+        """Get cached info for several pumps in one pass
+
+        Reads only the local cache (no I2C), resolving calibration from the
+        calibration cache so callers don't need a per-pump is_calibrated().
+
+        Args:
+            pump_ids: Iterable of pump IDs
+            fields: Optional iterable of info keys to copy (default: all)
+
+        Returns:
+            dict: {pump_id: info dict} for every valid ID
+        """
+        pump_info = self.pump_info
+        calibration_status = self.calibration_status
+        result = {}
+        for pump_id in pump_ids:
+            info = pump_info.get(pump_id)
+            if info is None:
+                continue
+            if fields is None:
+                info = info.copy()
+            else:
+                info = {field: info[field] for field in fields if field in info}
+            info['calibrated'] = calibration_status.get(pump_id, 0) > 0
+            result[pump_id] = info
+        return result
     
     def poll_pump_voltage(self, pump_id):
         """Poll voltage from a specific pump"""
@@ -517,9 +677,13 @@ class EZOPumpController:
                 self.poll_pump_voltage(pump_id)
     
     def get_all_pumps_status(self):
-        """Get status of all pumps"""
+        """Get a snapshot (copy) of all pump statuses"""
         return {pump_id: info.copy() for pump_id, info in self.pump_info.items()}
     
+    def get_all_pumps_status_view(self):
+        """Get read-only live views of all pump statuses (no copying)"""
+        return self._status_view
+    
     def emergency_stop(self):
         """Emergency stop all pumps"""
         logger.warning("Emergency stop - stopping all pumps")
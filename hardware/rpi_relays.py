@@ -135,12 +135,31 @@ class RelayController:
             return False
     
     def set_all_relays(self, state):
-        """Set all relays to the same state"""
-        success_count = 0
+        """Set all relays to the same state
+
+        Checks GPIO once and writes the pins directly rather than going
+        through set_relay() (ID validation, init check and a log line per
+        relay) - this is the emergency-stop and shutdown path.
+        """
+        if not self._ensure_gpio_initialized():
+            logger.error("GPIO not initialized - cannot set all relays")
+            return False
+        
+        if RELAY_ACTIVE_HIGH:
+            gpio_state = 1 if state else 0  # HIGH = ON, LOW = OFF
+        else:
+            gpio_state = 0 if state else 1  # LOW = ON, HIGH = OFF
         
-        for relay_id in self.relay_pins:
-            if self.set_relay(relay_id, state):
+        success_count = 0
+        for relay_id, pin in self.relay_pins.items():
+            try:
+                lgpio.gpio_write(self.h, pin, gpio_state)
+                self.relay_states[relay_id] = state
                 success_count += 1
+            except Exception as e:
+                logger.error(f"Error setting relay {relay_id}: {e}")
+                # If GPIO operation fails, mark as uninitialized to force retry
+                self._gpio_initialized = False
         
         state_str = "ON" if state else "OFF"
         logger.info(f"Set {success_count}/{len(self.relay_pins)} relays to {state_str}")
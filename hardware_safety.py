@@ -32,6 +32,15 @@ except ImportError:
         BCM = 1
     GPIO = MockGPIO()
 
+# Resolved once here rather than on every I2CBusManager.get_bus() call.
+# Blinka's `board` can raise more than ImportError on unsupported hosts.
+try:
+    import board
+    import busio
+    I2C_LIBS_AVAILABLE = True
+except Exception:
+    I2C_LIBS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -70,8 +79,10 @@ class InstanceLockManager:
                 print(f"Failed to create lock file: {e}")
                 return False
             else:
-                with os.fdopen(fd, 'w') as f:
-                    f.write(str(self.pid))
+                try:
+                    os.write(fd, str(self.pid).encode())
+                finally:
+                    os.close(fd)
                 print(f"Instance lock acquired (PID {self.pid})")
                 return True
 
@@ -81,8 +92,7 @@ class InstanceLockManager:
     def _clear_if_stale(self) -> bool:
         """Remove the lock file if it is stale/corrupt. Return True if removed."""
         try:
-            with open(self.lock_file, 'r') as f:
-                old_pid = int(f.read().strip())
+            old_pid = self._read_lock_pid()
         except (ValueError, FileNotFoundError):
             # Corrupt contents or it vanished underneath us - treat as stale.
             print("Removing invalid lock file")
@@ -106,16 +116,27 @@ class InstanceLockManager:
             print(f"Another instance (PID {old_pid}) is already running. Exiting...")
             return False
     
+    def _read_lock_pid(self) -> int:
+        """Read the PID stored in the lock file.
+
+        Raw os.open/os.read: the file only ever holds a PID, so skip the
+        buffered text-file machinery. Raises FileNotFoundError if there is no
+        lock file and ValueError if its contents are not a PID.
+        """
+        fd = os.open(self.lock_file, os.O_RDONLY)
+        try:
+            return int(os.read(fd, 32).strip())
+        finally:
+            os.close(fd)
+    
     def release_lock(self):
         """Release instance lock"""
         try:
-            if os.path.exists(self.lock_file):
-                with open(self.lock_file, 'r') as f:
-                    lock_pid = int(f.read().strip())
-                
-                if lock_pid == self.pid:
-                    os.remove(self.lock_file)
-                    print(f"Instance lock released (PID {self.pid})")
+            if self._read_lock_pid() == self.pid:
+                os.remove(self.lock_file)
+                print(f"Instance lock released (PID {self.pid})")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error releasing lock: {e}")
 
@@ -131,7 +152,8 @@ class GPIOResourceManager:
         self._used_pins = set()
     
     def is_gpio_in_use(self, pin: int) -> bool:
-        """Check if GPIO pin is already in use"""
+        """Check if GPIO pin is already in use (diagnostic probe only;
+        safe_gpio_setup detects a busy pin from its own setup call)"""
         try:
             GPIO.setup(pin, GPIO.OUT)
             GPIO.cleanup(pin)
@@ -142,18 +164,17 @@ class GPIOResourceManager:
     
     def safe_gpio_setup(self, pin: int, mode, retries: int = 3) -> bool:
         """Safely setup GPIO with retries"""
+        # A pin that is in use makes GPIO.setup raise, so the real setup call
+        # doubles as the busy check - no separate setup/cleanup probe.
         for attempt in range(retries):
             try:
-                if not self.is_gpio_in_use(pin):
-                    GPIO.setup(pin, mode)
-                    self._used_pins.add(pin)
-                    return True
-                else:
-                    print(f"GPIO pin {pin} is busy, waiting... (attempt {attempt + 1})")
-                    time.sleep(1)
+                GPIO.setup(pin, mode)
+                self._used_pins.add(pin)
+                return True
             except Exception as e:
-                logger.error(f"GPIO setup failed for pin {pin}: {e}")
-                time.sleep(1)
+                logger.warning(f"GPIO pin {pin} busy or setup failed (attempt {attempt + 1}): {e}")
+                if attempt < retries - 1:
+                    time.sleep(1)
         
         logger.error(f"Failed to setup GPIO pin {pin} after {retries} attempts")
         return False
@@ -198,14 +219,11 @@ class I2CBusManager:
         with self._i2c_lock:
             try:
                 if self._bus is None or self._bus_number != bus_number:
-                    # Import here to avoid issues if not available
-                    try:
-                        import board
-                        import busio
+                    if I2C_LIBS_AVAILABLE:
                         self._bus = busio.I2C(board.SCL, board.SDA)
                         self._bus_number = bus_number
                         logger.info(f"I2C bus {bus_number} initialized")
-                    except ImportError:
+                    else:
                         logger.warning("I2C libraries not available, using mock")
                         self._bus = MockI2CBus()
                 
@@ -244,6 +262,7 @@ class HardwareSafetyManager:
         self.gpio_manager = GPIOResourceManager()
         self.i2c_manager = I2CBusManager()
         self._shutdown_handlers_registered = False
+        self._cleanup_done = False
     
     def setup_safety_systems(self) -> bool:
         """Setup all safety systems"""
@@ -273,15 +292,24 @@ class HardwareSafetyManager:
         
         def cleanup_handler():
             """Main cleanup handler"""
+            if self._cleanup_done:
+                return
+            self._cleanup_done = True
             print("Performing hardware cleanup...")
             self.gpio_manager.cleanup_gpio()
             self.i2c_manager.close_bus()
             self.lock_manager.release_lock()
         
         def signal_handler(signum, frame):
-            """Handle shutdown signals"""
+            """Handle shutdown signals
+
+            Only unwinds the main thread. Cleanup then runs once, from atexit,
+            after handlers registered later (app.py's cleanup_hardware, which
+            turns the relays off) rather than inside whatever frame the signal
+            interrupted. Background worker threads are not stopped first, so
+            cleanup can still overlap an I2C transaction on one of them.
+            """
             print(f"Received signal {signum}, shutting down gracefully...")
-            cleanup_handler()
             sys.exit(0)
         
         # Register handlers
@@ -25,7 +25,6 @@ from config import (
     LOG_LEVELS,
     STATUS_UPDATE_INTERVAL,
     PUMP_CHECK_INTERVAL,
-    COMMAND_TIMEOUT,
     USE_MOCK_HARDWARE,
     MOCK_SETTINGS,
     MESSAGE_FORMATS,
@@ -56,11 +55,16 @@ for component, level in LOG_LEVELS.items():
     component_logger = logging.getLogger(component)
     component_logger.setLevel(getattr(logging, level))
 
+# Pump info fields read by the per-tick dispense progress update
+_PUMP_TICK_FIELDS = ('is_dispensing', 'current_volume', 'target_volume')
+
 class FeedControlSystem:
     def __init__(self, use_mock_flow=None):
         """Initialize the complete feed control system"""
         self.running = False
-        self.command_queue = queue.Queue()
+        # Many API threads produce, the worker thread is the single consumer.
+        # SimpleQueue is the C-implemented unbounded FIFO: put() never blocks.
+        self.command_queue = queue.SimpleQueue()
         self.worker_thread = None
         self.message_callback = None
         
@@ -69,11 +73,13 @@ class FeedControlSystem:
             use_mock_flow = MOCK_SETTINGS.get('flow_meters', False)
 
         # Shared I2C bus lock. The pump controller and the EC/pH sensor
-        # controller open separate smbus2 handles on the SAME physical bus
+        # controller share one smbus2 handle on the same physical bus
         # (/dev/i2c-1) and are driven from different threads (the command
-        # worker and the sensor monitoring thread). Serialize every bus
-        # transaction through this one lock so a sensor read can never
-        # interleave between a pump's write and its read-back.
+        # worker and the sensor monitoring thread). The controllers hold this
+        # lock only around each individual write or read, so the bus is free
+        # while a circuit is processing. A command's write -> wait -> read
+        # transaction is kept intact by each controller's per-address locks,
+        # not by this lock.
         self._i2c_lock = threading.Lock()
 
         # Initialize controllers
@@ -124,7 +130,11 @@ class FeedControlSystem:
                 self.sensor_controller = MockEZOSensorController()
                 self.sensor_controller.connect()
             else:
-                self.sensor_controller = EZOSensorController(i2c_lock=self._i2c_lock)
+                # Reuse the pump controller's open bus handle when there is one
+                self.sensor_controller = EZOSensorController(
+                    i2c_lock=self._i2c_lock,
+                    bus=getattr(self.pump_controller, 'bus', None)
+                )
                 if self.sensor_controller.connect():
                     logger.info(f"✓ EZO pH/EC sensors initialized via I2C")
                 else:
@@ -227,15 +237,17 @@ class FeedControlSystem:
         # Emergency stop all devices
         self.emergency_stop()
         
-        # Close all controllers
+        # Close all controllers. The sensor controller goes first: it stops
+        # its monitoring thread before the pump controller closes the I2C
+        # handle the two share.
+        if self.sensor_controller:
+            self.sensor_controller.close()
         if self.pump_controller:
             self.pump_controller.close()
         if self.relay_controller:
             self.relay_controller.cleanup()
         if self.flow_controller:
             self.flow_controller.cleanup()
-        if self.sensor_controller:
-            self.sensor_controller.close()
         if self.tank_monitor_manager:
             self.tank_monitor_manager.stop_all()
         if self.soil_sensor_manager:
@@ -247,25 +259,28 @@ class FeedControlSystem:
         """Main worker loop"""
         while self.running:
             try:
-                # Process commands
+                # Process commands (blocks briefly, waking as soon as one arrives)
                 self._process_commands()
                 
                 # Update device statuses
                 self._update_devices()
                 
-                time.sleep(0.01)  # Small delay
-                
             except Exception as e:
                 logger.error(f"Error in worker loop: {e}")
                 time.sleep(1)
     
-    def _process_commands(self):
-        """Process queued commands"""
+    def _process_commands(self, timeout=0.01):
+        """Process queued commands
+
+        Waits up to `timeout` seconds for a command instead of polling the
+        queue and sleeping, so a queued command is executed as soon as it
+        arrives while the loop still wakes regularly for device updates.
+        """
         try:
-            command = self.command_queue.get(timeout=0.001)  # Very short timeout
-            self._execute_command(command)
+            command = self.command_queue.get(timeout=timeout)
         except queue.Empty:
-            pass
+            return
+        self._execute_command(command)
     
     def _execute_command(self, command_str):
         """Execute a command string"""
@@ -426,9 +441,13 @@ class FeedControlSystem:
                 # Check for voltage polling needed (periodic voltage checks)
                 self.pump_controller.check_voltage_polling_needed()
                 
-                for pump_addr in get_available_pumps():
-                    pump_info = self.pump_controller.get_pump_info(pump_addr)
-                    if pump_info and pump_info['is_dispensing']:
+                # One snapshot of the needed fields for every pump, rather
+                # than a full get_pump_info() copy per pump per tick
+                pump_snapshot = self.pump_controller.get_pump_info_batch(
+                    get_available_pumps(), _PUMP_TICK_FIELDS
+                )
+                for pump_addr, pump_info in pump_snapshot.items():
+                    if pump_info['is_dispensing']:
                         still_running = self.pump_controller.check_pump_status(pump_addr)
                         
                         # Send status update
@@ -447,18 +466,18 @@ class FeedControlSystem:
             self.last_status_update = current_time
             
             if self.flow_controller:
-                for meter_id in get_available_flow_meters():
-                    still_running = self.flow_controller.update_flow_status(meter_id)
-                    status = self.flow_controller.get_flow_status(meter_id)
-
-                    if status and status['status'] == 1:  # Active
+                # One pass over all meters; the returned states are live, so
+                # read them here without copying
+                meters = self.flow_controller.update_all_flow_status()
+                for meter_id, meter in meters.items():
+                    if meter['status'] == 1:  # Active
                         message = MESSAGE_FORMATS["flow_status"].format(
                             flow_id=meter_id,
-                            gallons=status['current_gallons'],
-                            pulses=status['pulse_count']
+                            gallons=meter['current_gallons'],
+                            pulses=meter['pulse_count']
                         )
                         self.send_message(message)
-                    elif self.flow_controller.is_completed_and_unnotified(meter_id):
+                    elif meter['status'] == 2 and not meter['completion_notified']:
                         # Flow completed and not yet notified - send message once
                         message = MESSAGE_FORMATS["flow_complete"].format(flow_id=meter_id)
                         self.send_message(message)
@@ -485,7 +504,7 @@ class FeedControlSystem:
         
         # Show pump info
         if self.pump_controller:
-            all_pumps = self.pump_controller.get_all_pumps_status()
+            all_pumps = self.pump_controller.get_all_pumps_status_view()
             for pump_id, info in all_pumps.items():
                 if info['connected']:
                     pump_name = get_pump_name(pump_id)
@@ -510,12 +529,8 @@ class FeedControlSystem:
     
     def send_command(self, command):
         """Queue a command for processing"""
-        try:
-            self.command_queue.put(command, timeout=COMMAND_TIMEOUT)
-            return True
-        except queue.Full:
-            logger.error("Command queue is full")
-            return False
+        self.command_queue.put(command)
+        return True
     
     def emergency_stop(self):
         """Emergency stop all operations"""
@@ -106,67 +106,64 @@ def main():
     try:
         # Initialize controller
         print("🔧 Initializing flow meter controller...")
-        controller = FlowMeterController()
-        
-        # Get meter info
-        meter_name = get_flow_meter_name(meter_id)
-        status = controller.get_flow_status(meter_id)
-        gpio_pin = status.get('name', 'Unknown') if status else 'Unknown'
-        
-        # Print header
-        print_header(meter_id, meter_name, gpio_pin)
-        
-        # Start monitoring (don't set target - just count pulses)
-        controller.flow_meters[meter_id]['status'] = 1  # Activate for monitoring
-        controller.flow_meters[meter_id]['pulse_count'] = 0  # Reset counter
-        
-        # Get initial values
-        start_time = time.time()
-        last_pulse_count = 0
-        last_time = start_time
-        
-        # Main monitoring loop
-        while running:
-            current_time = time.time()
-            elapsed_time = current_time - start_time
-            
-            # Get current status
+        with FlowMeterController() as controller:
+            # Get meter info
+            meter_name = get_flow_meter_name(meter_id)
             status = controller.get_flow_status(meter_id)
-            if not status:
-                print("❌ Error: Could not get meter status")
-                break
-                
-            pulse_count = status['pulse_count']
-            pulses_per_gallon = status['pulses_per_gallon']
-            
-            # Calculate metrics
-            total_gallons = pulse_count / pulses_per_gallon
-            current_gpm = calculate_flow_rate(pulse_count, elapsed_time, pulses_per_gallon)
-            
-            # Calculate instantaneous rate (pulses in last second)
-            time_since_last = current_time - last_time
-            if time_since_last >= 1.0:  # Update every second
-                pulses_this_period = pulse_count - last_pulse_count
-                instant_gpm = calculate_flow_rate(pulses_this_period, time_since_last, pulses_per_gallon)
-                
-                # Format time
-                time_str = f"{elapsed_time:8.1f}s"
-                
-                # Print current status
-                print(f"{time_str:<12} {pulse_count:<8} {pulses_this_period:<10} {total_gallons:<10.3f} {instant_gpm:<8.2f}")
-                
-                # Update for next iteration
-                last_pulse_count = pulse_count
-                last_time = current_time
-            
-            time.sleep(0.1)  # Small delay to prevent CPU hammering
-            
+            gpio_pin = status.get('name', 'Unknown') if status else 'Unknown'
+
+            # Print header
+            print_header(meter_id, meter_name, gpio_pin)
+
+            # Start monitoring (don't set target - just count pulses)
+            controller.flow_meters[meter_id]['status'] = 1  # Activate for monitoring
+            controller.flow_meters[meter_id]['pulse_count'] = 0  # Reset counter
+
+            # Get initial values
+            start_time = time.time()
+            last_pulse_count = 0
+            last_time = start_time
+
+            # Main monitoring loop
+            while running:
+                current_time = time.time()
+                elapsed_time = current_time - start_time
+
+                # Get current status
+                status = controller.get_flow_status(meter_id)
+                if not status:
+                    print("❌ Error: Could not get meter status")
+                    break
+
+                pulse_count = status['pulse_count']
+                pulses_per_gallon = status['pulses_per_gallon']
+
+                # Calculate metrics
+                total_gallons = pulse_count / pulses_per_gallon
+                current_gpm = calculate_flow_rate(pulse_count, elapsed_time, pulses_per_gallon)
+
+                # Calculate instantaneous rate (pulses in last second)
+                time_since_last = current_time - last_time
+                if time_since_last >= 1.0:  # Update every second
+                    pulses_this_period = pulse_count - last_pulse_count
+                    instant_gpm = calculate_flow_rate(pulses_this_period, time_since_last, pulses_per_gallon)
+
+                    # Format time
+                    time_str = f"{elapsed_time:8.1f}s"
+
+                    # Print current status
+                    print(f"{time_str:<12} {pulse_count:<8} {pulses_this_period:<10} {total_gallons:<10.3f} {instant_gpm:<8.2f}")
+
+                    # Update for next iteration
+                    last_pulse_count = pulse_count
+                    last_time = current_time
+
+                time.sleep(0.1)  # Small delay to prevent CPU hammering
+
     except KeyboardInterrupt:
         signal_handler(None, None)
     except Exception as e:
         print(f"\n❌ Error during test: {e}")
-        if controller:
-            controller.cleanup()
         sys.exit(1)
 
 if __name__ == "__main__":